@@ -48,8 +48,10 @@ CREATE TABLE orders (
 -- ---------------------------------------------------------------------------
 -- Indexes for query performance
 -- ---------------------------------------------------------------------------
--- Cart lookups are always by session_id (fetch current cart)
-CREATE INDEX idx_cart_items_session_id ON cart_items(session_id);
+-- Cart lookups are always by session_id (fetch current cart). Unique on
+-- (session_id, product_id) so cart-service can upsert lines with
+-- INSERT ... ON CONFLICT instead of a check-then-write sequence.
+CREATE UNIQUE INDEX idx_cart_items_session_product ON cart_items(session_id, product_id);
 
 -- Product lookups in cart joins
 CREATE INDEX idx_cart_items_product_id ON cart_items(product_id);
@@ -6,16 +6,33 @@ an X-Service-Node header so monitoring can distinguish real vs decoy traffic.
 All requests are logged to stdout in JSON format for structured log ingestion.
 """
 
-import json
 import logging
 import os
+import queue
 import sys
+import threading
 import time
+import weakref
 from datetime import datetime, timezone
+from decimal import Decimal
 
+import orjson
 import psycopg2
 import psycopg2.pool
-from flask import Flask, g, jsonify, request
+from flask import Flask, Response, g, request, stream_with_context
+from flask.json.provider import JSONProvider
+
+# ---------------------------------------------------------------------------
+# gevent compatibility
+# ---------------------------------------------------------------------------
+# Under gunicorn's gevent worker, psycopg2 must yield to the event loop while
+# waiting on Postgres — otherwise one slow query stalls every greenlet in the
+# worker. The wait callback has to be installed before the first connection
+# is opened. Skipped for the Flask dev server (plain threads, no event loop).
+if __name__ != "__main__":
+    from psycogreen.gevent import patch_psycopg
+
+    patch_psycopg()
 
 # ---------------------------------------------------------------------------
 # App setup
@@ -23,17 +40,68 @@ from flask import Flask, g, jsonify, request
 app = Flask(__name__)
 
 
+# ---------------------------------------------------------------------------
+# orjson-backed JSON provider — ~2-6x faster than stdlib json for the
+# list-of-dicts payloads this service serves. orjson emits datetimes
+# natively; Decimals go through _orjson_default.
+# ---------------------------------------------------------------------------
+def _orjson_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_orjson_default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app.json = OrjsonProvider(app)
+
+
+
+# ---------------------------------------------------------------------------
+# Cached wall-clock timestamp — log lines don't need sub-second precision,
+# so a daemon thread refreshes one ISO string per second instead of every
+# request paying for datetime.now().isoformat(). Set
+# HIGH_PRECISION_TIMESTAMPS=1 to go back to exact per-call timestamps.
+# ---------------------------------------------------------------------------
+HIGH_PRECISION_TIMESTAMPS = os.environ.get("HIGH_PRECISION_TIMESTAMPS", "") == "1"
+
+_now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _refresh_now_iso():
+    global _now_iso
+    while True:
+        _now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        time.sleep(1)
+
+
+if not HIGH_PRECISION_TIMESTAMPS:
+    threading.Thread(target=_refresh_now_iso, daemon=True).start()
+
+
+def log_timestamp():
+    if HIGH_PRECISION_TIMESTAMPS:
+        return datetime.now(timezone.utc).isoformat()
+    return _now_iso
+
+
 # ---------------------------------------------------------------------------
 # Structured JSON logging to stdout
 # ---------------------------------------------------------------------------
 class JsonFormatter(logging.Formatter):
     def format(self, record):
         log_record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": log_timestamp(),
             "level": record.levelname,
             "message": record.getMessage(),
         }
-        return json.dumps(log_record)
+        return orjson.dumps(log_record).decode()
 
 
 handler = logging.StreamHandler(sys.stdout)
@@ -44,156 +112,357 @@ app.logger.setLevel(logging.INFO)
 logging.getLogger("werkzeug").setLevel(logging.WARNING)
 
 # ---------------------------------------------------------------------------
-# Database connection pool (max 3 connections for low-resource system)
+# Database connection pool — ThreadedConnectionPool is safe under both plain
+# threads and gevent (its locks are monkey-patched). Size DB_POOL_SIZE to
+# roughly worker_connections / workers per pod.
 # ---------------------------------------------------------------------------
 DB_POOL = None
+_db_pool_lock = threading.Lock()
 
 
 def get_db_pool():
-    """Lazily initialise the connection pool on first use."""
+    """Lazily initialise the connection pool on first use (thread-safe)."""
     global DB_POOL
     if DB_POOL is None:
-        DB_POOL = psycopg2.pool.SimpleConnectionPool(
-            minconn=1,
-            maxconn=3,
-            host=os.environ.get("DB_HOST", "postgres"),
-            port=int(os.environ.get("DB_PORT", "5432")),
-            dbname=os.environ.get("DB_NAME", "ecommerce"),
-            user=os.environ.get("DB_USER", "appuser"),
-            password=os.environ.get("DB_PASSWORD", ""),
-        )
+        with _db_pool_lock:
+            if DB_POOL is not None:
+                return DB_POOL
+            DB_POOL = psycopg2.pool.ThreadedConnectionPool(
+                minconn=int(os.environ.get("DB_POOL_MIN", "4")),
+                maxconn=int(os.environ.get("DB_POOL_SIZE", "16")),
+                host=os.environ.get("DB_HOST", "postgres"),
+                port=int(os.environ.get("DB_PORT", "5432")),
+                dbname=os.environ.get("DB_NAME", "ecommerce"),
+                user=os.environ.get("DB_USER", "appuser"),
+                password=os.environ.get("DB_PASSWORD", ""),
+            )
     return DB_POOL
 
 
+# ---------------------------------------------------------------------------
+# Session-level prepared statements — PREPARE once per pooled connection so
+# Postgres skips parse/plan/rewrite on every request that reuses it.
+# ---------------------------------------------------------------------------
+PREPARED_STATEMENTS_SQL = """
+    PREPARE prod_get (integer) AS
+    SELECT row_to_json(t)::text
+    FROM (
+        SELECT id, name, description, price, image_url, category, stock_count
+        FROM products
+        WHERE id = $1
+    ) t;
+
+    PREPARE prod_by_category (text) AS
+    SELECT COALESCE(json_agg(row_to_json(t) ORDER BY t.id), '[]'::json)::text
+    FROM (
+        SELECT id, name, description, price, image_url, category, stock_count
+        FROM products
+        WHERE category = $1
+    ) t;
+"""
+
+# psycopg2's C connection type doesn't take custom attributes, so track
+# prepared connections in a WeakSet keyed on the objects themselves. When
+# the pool discards a dead connection its entry vanishes with it, so a
+# replacement connection can never be mistaken for an already-prepared
+# one (tracking raw id() values had exactly that aliasing problem).
+_prepared_conns = weakref.WeakSet()
+
+
+def _ensure_prepared(conn):
+    if conn in _prepared_conns:
+        return
+    with conn.cursor() as cur:
+        cur.execute(PREPARED_STATEMENTS_SQL)
+    conn.commit()
+    _prepared_conns.add(conn)
+
+
 def get_db():
     """Get a connection from the pool, stored on Flask's `g` for the request."""
     if "db" not in g:
         pool = get_db_pool()
         g.db = pool.getconn()
+        _ensure_prepared(g.db)
     return g.db
 
 
 @app.teardown_appcontext
 def return_db(exc):
-    """Return the connection to the pool at the end of the request."""
+    """Safety net: return the connection at end of request if still held.
+
+    Routes release explicitly via release_db(); this only covers error
+    paths. Checking DB_POOL directly avoids lazily creating the pool for
+    requests that never touched the database.
+    """
     db = g.pop("db", None)
-    if db is not None:
+    if db is not None and DB_POOL is not None:
         try:
-            pool = get_db_pool()
-            pool.putconn(db)
+            DB_POOL.putconn(db)
         except Exception:
             pass
 
 
+def release_db():
+    """Return the request's connection to the pool immediately.
+
+    Called right after the last DB statement so the connection is free for
+    other greenlets while this request serialises its response, instead of
+    being held until teardown.
+    """
+    db = g.pop("db", None)
+    if db is not None and DB_POOL is not None:
+        DB_POOL.putconn(db)
+
+
+
+# ---------------------------------------------------------------------------
+# Access-log batching — per-request lines are queued and flushed to stdout
+# by a background thread, so the request path never blocks on log I/O.
+# Health-probe requests are not logged at all.
+# ---------------------------------------------------------------------------
+_LOG_FLUSH_INTERVAL = 0.1  # seconds
+_LOG_FLUSH_THRESHOLD = 64  # wake the flusher early past this backlog
+
+_log_queue = queue.SimpleQueue()
+_log_wake = threading.Event()
+
+
+def _queue_access_log(line):
+    """Queue a serialised (bytes) access-log line for the flusher thread."""
+    _log_queue.put(line)
+    if _log_queue.qsize() >= _LOG_FLUSH_THRESHOLD:
+        _log_wake.set()
+
+
+def _log_flush_loop():
+    while True:
+        _log_wake.wait(_LOG_FLUSH_INTERVAL)
+        _log_wake.clear()
+        lines = []
+        while True:
+            try:
+                lines.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if lines:
+            sys.stdout.buffer.write(b"\n".join(lines) + b"\n")
+            sys.stdout.buffer.flush()
+
+
+_log_flush_thread = threading.Thread(target=_log_flush_loop, daemon=True)
+_log_flush_thread.start()
+
+
 # ---------------------------------------------------------------------------
 # Middleware: custom header + request logging
 # ---------------------------------------------------------------------------
+SERVICE_NODE = "real-product-svc"
+
+
 @app.before_request
 def start_timer():
-    g.start_time = time.monotonic()
+    g.start_ns = time.perf_counter_ns()
 
 
 @app.after_request
 def after_request(response):
     # Tag every response so monitoring can tell real from decoy
-    response.headers["X-Service-Node"] = "real-product-svc"
+    response.headers["X-Service-Node"] = SERVICE_NODE
+
+    # Health probes fire at ~1Hz per kubelet — skip logging them entirely
+    if request.path == "/health":
+        return response
 
     # Structured request log
-    duration_ms = round(
-        (time.monotonic() - g.get("start_time", time.monotonic())) * 1000, 2
-    )
+    if not app.logger.isEnabledFor(logging.INFO):
+        return response
+
+    # Integer microseconds — no float multiply/round on the hot path
+    duration_us = (time.perf_counter_ns() - g.get("start_ns", time.perf_counter_ns())) // 1000
     log_entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": log_timestamp(),
         "method": request.method,
         "path": request.path,
         "source_ip": request.remote_addr,
         "user_agent": request.headers.get("User-Agent", ""),
         "response_code": response.status_code,
-        "duration_ms": duration_ms,
+        "duration_us": duration_us,
     }
-    app.logger.info(json.dumps(log_entry))
+    _queue_access_log(orjson.dumps(log_entry))
     return response
 
 
 # ---------------------------------------------------------------------------
-# Helper: serialise a product row to dict
+# SQL: serialise rows to JSON inside Postgres (json_agg/row_to_json) so the
+# driver hands back a single ready-to-send JSON string — no per-row Python
+# dict construction on the hot path.
 # ---------------------------------------------------------------------------
-PRODUCT_COLUMNS = (
-    "id",
-    "name",
-    "description",
-    "price",
-    "image_url",
-    "category",
-    "stock_count",
-)
+# One JSON document per row, streamed through a named server-side cursor so
+# a large catalog never has to sit fully in driver memory.
+PRODUCTS_STREAM_SQL = """
+    SELECT row_to_json(t)::text
+    FROM (
+        SELECT id, name, description, price, image_url, category, stock_count
+        FROM products
+        ORDER BY id
+    ) t
+"""
+PRODUCTS_STREAM_ITERSIZE = 500
+
+
+
+# ---------------------------------------------------------------------------
+# Catalog response cache — the catalog changes rarely relative to read QPS,
+# so cache the ready-to-send JSON body per endpoint for a short TTL. Repeat
+# hits skip both Postgres and serialization. Staleness is bounded by the TTL
+# (stock counts may lag checkout by up to CATALOG_TTL_S seconds).
+# ---------------------------------------------------------------------------
+CATALOG_TTL_S = float(os.environ.get("CATALOG_TTL_S", "30"))
+_CATALOG_CACHE_MAX_KEYS = 256  # guard against unbounded category keys
+
+_catalog_cache = {}  # key -> (expires_at_monotonic, body)
+_catalog_cache_lock = threading.Lock()
+
+
+def _catalog_cache_get(key):
+    entry = _catalog_cache.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
 
 
-def row_to_dict(row):
-    d = dict(zip(PRODUCT_COLUMNS, row))
-    d["price"] = float(d["price"])  # Decimal → float for JSON
-    return d
+def _catalog_cache_put(key, body):
+    with _catalog_cache_lock:
+        if len(_catalog_cache) >= _CATALOG_CACHE_MAX_KEYS:
+            _catalog_cache.clear()
+        _catalog_cache[key] = (time.monotonic() + CATALOG_TTL_S, body)
 
 
 # ---------------------------------------------------------------------------
-# Routes
+# Pre-encoded constant responses — fixed-shape error payloads are encoded
+# once at import time, so frequent error paths skip the per-request dict
+# allocation and JSON encode (Response objects can't be reused, bytes can).
 # ---------------------------------------------------------------------------
-@app.route("/health")
-def health():
-    return jsonify({"status": "healthy", "service": "product-service"})
+_ERR_UNAVAILABLE = b'{"error":"Service temporarily unavailable"}'
+_ERR_INVALID_ID = b'{"error":"Invalid product ID \\u2014 must be numeric"}'
+_ERR_NOT_FOUND = b'{"error":"Product not found"}'
+
+
+def json_error(body, status):
+    """Build a Response around one of the pre-encoded error bodies."""
+    return Response(body, status=status, mimetype="application/json")
 
 
+# ---------------------------------------------------------------------------
+# Routes
+# ---------------------------------------------------------------------------
 @app.route("/api/products")
 def list_products():
+    cached = _catalog_cache_get("all")
+    if cached is not None:
+        return Response(cached, mimetype="application/json")
+
     try:
         conn = get_db()
-        with conn.cursor() as cur:
-            cur.execute(
-                "SELECT id, name, description, price, image_url, category, stock_count FROM products ORDER BY id"
-            )
-            rows = cur.fetchall()
-        return jsonify([row_to_dict(r) for r in rows])
     except psycopg2.Error as e:
         app.logger.error(f"Database error: {e}")
-        return jsonify({"error": "Service temporarily unavailable"}), 503
+        return json_error(_ERR_UNAVAILABLE, 503)
+
+    @stream_with_context
+    def generate():
+        # Accumulate the streamed chunks so a complete pass also refreshes
+        # the catalog cache. The connection goes back to the pool in the
+        # normal teardown once the generator is exhausted.
+        body_parts = [b"["]
+        yield b"["
+        try:
+            with conn.cursor(name="list_products_srv") as cur:
+                cur.itersize = PRODUCTS_STREAM_ITERSIZE
+                cur.execute(PRODUCTS_STREAM_SQL)
+                first = True
+                for (row_json,) in cur:
+                    chunk = row_json.encode() if first else b"," + row_json.encode()
+                    first = False
+                    body_parts.append(chunk)
+                    yield chunk
+        except psycopg2.Error as e:
+            # Mid-stream failure: the status line is already sent, so just
+            # log and truncate rather than caching a partial body.
+            app.logger.error(f"Database error: {e}")
+            return
+        body_parts.append(b"]")
+        yield b"]"
+        _catalog_cache_put("all", b"".join(body_parts))
+
+    return Response(generate(), mimetype="application/json")
 
 
 @app.route("/api/products/<id>")
 def get_product(id):
     # Input validation: reject non-numeric IDs
     if not id.isdigit():
-        return jsonify({"error": "Invalid product ID — must be numeric"}), 400
+        return json_error(_ERR_INVALID_ID, 400)
 
     try:
         conn = get_db()
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT id, name, description, price, image_url, category, stock_count FROM products WHERE id = %s",
-                (int(id),),
-            )
+            cur.execute("EXECUTE prod_get(%s)", (int(id),))
             row = cur.fetchone()
+        release_db()
         if row is None:
-            return jsonify({"error": "Product not found"}), 404
-        return jsonify(row_to_dict(row))
+            return json_error(_ERR_NOT_FOUND, 404)
+        return Response(row[0], mimetype="application/json")
     except psycopg2.Error as e:
         app.logger.error(f"Database error: {e}")
-        return jsonify({"error": "Service temporarily unavailable"}), 503
+        return json_error(_ERR_UNAVAILABLE, 503)
 
 
 @app.route("/api/products/category/<category>")
 def products_by_category(category):
+    cache_key = f"cat:{category}"
+    cached = _catalog_cache_get(cache_key)
+    if cached is not None:
+        return Response(cached, mimetype="application/json")
+
     try:
         conn = get_db()
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT id, name, description, price, image_url, category, stock_count FROM products WHERE category = %s ORDER BY id",
-                (category,),
-            )
-            rows = cur.fetchall()
-        return jsonify([row_to_dict(r) for r in rows])
+            cur.execute("EXECUTE prod_by_category(%s)", (category,))
+            raw = cur.fetchone()[0]
+        release_db()
+        _catalog_cache_put(cache_key, raw)
+        return Response(raw, mimetype="application/json")
     except psycopg2.Error as e:
         app.logger.error(f"Database error: {e}")
-        return jsonify({"error": "Service temporarily unavailable"}), 503
+        return json_error(_ERR_UNAVAILABLE, 503)
+
+
+
+# ---------------------------------------------------------------------------
+# WSGI-level /health responder — kubelet probes hit this at ~1Hz per pod, so
+# answer before Flask builds a request context (no middleware, no logging,
+# no teardown/pool lookup).
+# ---------------------------------------------------------------------------
+_HEALTH_BODY = b'{"status":"healthy","service":"product-service"}'
+_flask_wsgi_app = app.wsgi_app
+
+
+def _health_short_circuit(environ, start_response):
+    if environ.get("PATH_INFO") == "/health":
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", "application/json"),
+                ("Content-Length", str(len(_HEALTH_BODY))),
+                ("X-Service-Node", SERVICE_NODE),
+            ],
+        )
+        return [_HEALTH_BODY]
+    return _flask_wsgi_app(environ, start_response)
+
+
+app.wsgi_app = _health_short_circuit
 
 
 # ---------------------------------------------------------------------------
@@ -9,13 +9,13 @@ resource cap.
 Architecture:
     - Main thread: Flask HTTP server (status/health endpoints)
     - Thread 1: Redis subscriber listening on "attack_detected" channel
-    - Thread 2: TTL cleanup loop running every 60 seconds
+    - Thread 2: TTL cleanup thread sleeping on an expiry heap
 
 Uses the official kubernetes Python client with in-cluster ServiceAccount
 authentication (deception-controller SA from rbac.yaml).
 """
 
-import json
+import heapq
 import logging
 import os
 import sys
@@ -23,14 +23,17 @@ import threading
 import time
 import uuid
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+import orjson
 import redis
+import urllib3
 from flask import Flask, g, jsonify, request
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
-from decoy_templates import create_decoy_set
+from decoy_templates import DEFAULT_TTL_MINUTES, create_decoy_set, sanitize_ip
 
 # ---------------------------------------------------------------------------
 # App setup
@@ -38,18 +41,35 @@ from decoy_templates import create_decoy_set
 app = Flask(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Cached wall-clock timestamp — events and log lines within the same second
+# share one ISO string instead of each paying for isoformat(), one of the
+# costlier datetime operations. The tuple swap is GIL-atomic.
+# ---------------------------------------------------------------------------
+_now_iso_cache = (0, "")
+
+
+def _now_iso():
+    sec = int(time.time())
+    cached_sec, cached = _now_iso_cache
+    if sec != cached_sec:
+        cached = datetime.now(timezone.utc).isoformat()
+        globals()["_now_iso_cache"] = (sec, cached)
+    return cached
+
+
 # ---------------------------------------------------------------------------
 # Structured JSON logging to stdout
 # ---------------------------------------------------------------------------
 class JsonFormatter(logging.Formatter):
     def format(self, record):
         log_record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "level": record.levelname,
             "service": "deception-controller",
             "message": record.getMessage(),
         }
-        return json.dumps(log_record)
+        return orjson.dumps(log_record).decode()
 
 
 handler = logging.StreamHandler(sys.stdout)
@@ -70,6 +90,8 @@ REDIS_URL = os.environ.get(
     "REDIS_URL", "redis://redis.monitoring.svc.cluster.local:6379"
 )
 DECOY_NAMESPACE = os.environ.get("DECOY_NAMESPACE", "decoy-pool")
+# Constant suffix of every decoy service FQDN, built once
+_SVC_DOMAIN = f"{DECOY_NAMESPACE}.svc.cluster.local"
 PORT = int(os.environ.get("PORT", "8086"))
 
 # Channel names
@@ -81,18 +103,22 @@ CH_ROUTING_UPDATE = "routing_update"
 MAX_DECOY_PODS = 15  # matches decoy-pool ResourceQuota
 MAX_DECOY_SETS = 5  # 15 pods / 3 pods per set
 POD_READY_TIMEOUT = 120  # seconds to wait for pods to become Ready
-TTL_CHECK_INTERVAL = 60  # seconds between TTL cleanup sweeps
+TTL_RECONCILE_INTERVAL = 3600  # seconds between TTL heap reconciliation passes
+K8S_REQUEST_TIMEOUT = 10  # bound every unary apiserver call
 
 # ---------------------------------------------------------------------------
 # Shared state
 # ---------------------------------------------------------------------------
+# Parsed once at import so /status doesn't re-run fromisoformat per probe
+STARTED_AT = datetime.now(timezone.utc)
+
 controller_stats = {
     "total_spawned_sets": 0,
     "total_cleaned_sets": 0,
     "total_attacks_received": 0,
     "total_duplicate_skipped": 0,
     "total_evictions": 0,
-    "started_at": datetime.now(timezone.utc).isoformat(),
+    "started_at": STARTED_AT.isoformat(),
     "active_decoy_sets": {},  # attack_id_short -> {attacker_ip, attack_type, created_at, pods: [...]}
 }
 stats_lock = threading.Lock()
@@ -101,6 +127,7 @@ stats_lock = threading.Lock()
 # Kubernetes client
 # ---------------------------------------------------------------------------
 k8s_core = None
+_k8s_init_lock = threading.Lock()
 
 
 def get_k8s_client():
@@ -108,51 +135,92 @@ def get_k8s_client():
     Initialise the Kubernetes CoreV1Api client.
 
     Uses in-cluster config when running inside a pod (ServiceAccount token),
-    falls back to kubeconfig for local development.
+    falls back to kubeconfig for local development. Double-checked locking:
+    the steady-state read is a plain (GIL-atomic) attribute access, the lock
+    is only taken during first init so the subscriber, TTL and Flask threads
+    never contend once the client exists.
     """
     global k8s_core
     if k8s_core is not None:
         return k8s_core
-    try:
-        config.load_incluster_config()
-        root_logger.info("Loaded in-cluster Kubernetes config")
-    except config.ConfigException:
+    with _k8s_init_lock:
+        if k8s_core is not None:
+            return k8s_core
         try:
-            config.load_kube_config()
-            root_logger.info("Loaded kubeconfig (local dev mode)")
+            config.load_incluster_config()
+            root_logger.info("Loaded in-cluster Kubernetes config")
         except config.ConfigException:
-            root_logger.error("Cannot load Kubernetes config")
-            return None
-    k8s_core = client.CoreV1Api()
-    return k8s_core
+            try:
+                config.load_kube_config()
+                root_logger.info("Loaded kubeconfig (local dev mode)")
+            except config.ConfigException:
+                root_logger.error("Cannot load Kubernetes config")
+                return None
+        # Size the urllib3 pool above the default of 4 so the subscriber,
+        # informer, creation pool and Flask threads all reuse kept-alive
+        # TLS connections instead of handshaking per call.
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = 32
+        # Retry transient apiserver errors at the transport layer so one
+        # blip doesn't fail a whole decoy spawn. Watches aren't affected:
+        # urllib3 only retries before the response starts streaming.
+        # Idempotent methods only (urllib3's default set): retrying a
+        # create whose response was lost after the mutation landed would
+        # surface as 409 AlreadyExists and miscount the spawn.
+        configuration.retries = urllib3.util.Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=(500, 502, 503, 504),
+        )
+        k8s_core = client.CoreV1Api(client.ApiClient(configuration))
+        return k8s_core
 
 
 # ---------------------------------------------------------------------------
 # Redis clients — separate for pub/sub (subscriber) and publishing
 # ---------------------------------------------------------------------------
+# One process-wide connection pool shared by the publisher and the
+# subscriber's reconnect path: reconnects reuse pooled sockets instead of
+# paying a fresh TCP handshake, and keepalive + periodic health checks
+# weed out connections dropped by idle timeouts before a publish hits them.
+_REDIS_POOL = redis.ConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=16,
+    socket_connect_timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+
 redis_publisher = None
 redis_subscriber = None
+_redis_init_lock = threading.Lock()
 
 
 def get_redis_publisher():
-    """Get or create the Redis client used for publishing events."""
+    """Get or create the Redis client used for publishing events.
+
+    Double-checked locking: lockless read once connected, lock only held
+    while (re)establishing the connection.
+    """
     global redis_publisher
     if redis_publisher is not None:
         return redis_publisher
-    try:
-        redis_publisher = redis.from_url(
-            REDIS_URL,
-            socket_connect_timeout=5,
-            socket_timeout=3,
-            retry_on_timeout=False,
-        )
-        redis_publisher.ping()
-        root_logger.info(f"Redis publisher connected to {REDIS_URL}")
-        return redis_publisher
-    except redis.RedisError as e:
-        root_logger.warning(f"Redis publisher unavailable: {e}")
-        redis_publisher = None
-        return None
+    with _redis_init_lock:
+        if redis_publisher is not None:
+            return redis_publisher
+        try:
+            # Socket options live on the pool; the connections stay in
+            # blocking mode so the same pool can serve the subscriber's
+            # indefinite listen(). Publish calls are small writes, so the
+            # health checks above bound how stale a socket can be.
+            redis_publisher = redis.Redis(connection_pool=_REDIS_POOL)
+            redis_publisher.ping()
+            root_logger.info(f"Redis publisher connected to {REDIS_URL}")
+            return redis_publisher
+        except redis.RedisError as e:
+            root_logger.warning(f"Redis publisher unavailable: {e}")
+            redis_publisher = None
+            return None
 
 
 def publish_event(channel, event):
@@ -161,13 +229,235 @@ def publish_event(channel, event):
     if client is None:
         return
     try:
-        client.publish(channel, json.dumps(event))
+        client.publish(channel, orjson.dumps(event))
     except redis.RedisError as e:
         root_logger.warning(f"Redis publish to {channel} failed: {e}")
         global redis_publisher
         redis_publisher = None
 
 
+def publish_events(entries):
+    """Publish several (channel, event) pairs in one Redis round-trip.
+
+    A non-transactional pipeline batches the back-to-back publishes the
+    spawn and expiry paths emit, costing one network write instead of one
+    RTT per event. Fails silently like publish_event.
+    """
+    client = get_redis_publisher()
+    if client is None:
+        return
+    try:
+        with client.pipeline(transaction=False) as pipe:
+            for channel, event in entries:
+                pipe.publish(channel, orjson.dumps(event))
+            pipe.execute()
+    except redis.RedisError as e:
+        root_logger.warning(f"Redis batched publish failed: {e}")
+        global redis_publisher
+        redis_publisher = None
+
+
+def _add_route_event(attacker_ip, attack_id, short_id):
+    """Build the (channel, payload) pair that routes an attacker IP to its
+    decoy set. Shared by the spawn and duplicate re-publish paths."""
+    return (
+        CH_ROUTING_UPDATE,
+        {
+            "timestamp": _now_iso(),
+            "type": "add_route",
+            "attacker_ip": attacker_ip,
+            "attack_id": attack_id,
+            "frontend_service": f"decoy-fe-{short_id}.{_SVC_DOMAIN}:3000",
+            "api_service": f"decoy-api-{short_id}.{_SVC_DOMAIN}:8081",
+            "db_service": f"decoy-db-{short_id}.{_SVC_DOMAIN}:5432",
+        },
+    )
+
+
+# ============================================================================
+# Pod cache — minimal informer over the decoy-pool namespace
+# ============================================================================
+
+
+class _DecoyPodCache:
+    """
+    Watch-backed local cache of decoy pods.
+
+    One long-lived watch on role=decoy replaces the repeated
+    list_namespaced_pod calls the lookup helpers used to issue on every
+    attack event and TTL tick. After the initial LIST, lookups are
+    in-memory dictionary reads with no apiserver round-trip. Secondary
+    indexes by attack-id and attacker-ip label are maintained under an
+    RLock; an expired watch (410 Gone) or any stream error triggers a
+    full relist.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._pods = {}  # pod name -> V1Pod
+        self._by_attack_id = defaultdict(set)  # short attack-id -> pod names
+        self._by_attacker_ip = defaultdict(set)  # safe attacker-ip -> pod names
+        self._synced = threading.Event()
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def ensure_started(self):
+        """Start the watch thread once (safe to call from any thread)."""
+        if self._started:
+            return
+        with self._start_lock:
+            if self._started:
+                return
+            threading.Thread(
+                target=self._run, daemon=True, name="pod-cache"
+            ).start()
+            self._started = True
+
+    def wait_synced(self, timeout=5):
+        """Block until the initial LIST has populated the cache."""
+        self.ensure_started()
+        return self._synced.wait(timeout)
+
+    # -- index maintenance --------------------------------------------------
+
+    def _set(self, pod):
+        name = pod.metadata.name
+        with self._lock:
+            self._drop(name)
+            self._pods[name] = pod
+            labels = pod.metadata.labels or {}
+            aid = labels.get("attack-id", "")
+            ip = labels.get("attacker-ip", "")
+            if aid:
+                self._by_attack_id[aid].add(name)
+            if ip:
+                self._by_attacker_ip[ip].add(name)
+
+    def _drop(self, name):
+        with self._lock:
+            pod = self._pods.pop(name, None)
+            if pod is None:
+                return
+            labels = pod.metadata.labels or {}
+            for index, key in (
+                (self._by_attack_id, labels.get("attack-id", "")),
+                (self._by_attacker_ip, labels.get("attacker-ip", "")),
+            ):
+                if key and key in index:
+                    index[key].discard(name)
+                    if not index[key]:
+                        del index[key]
+
+    def _replace_all(self, pods):
+        with self._lock:
+            self._pods.clear()
+            self._by_attack_id.clear()
+            self._by_attacker_ip.clear()
+            for pod in pods:
+                self._set(pod)
+
+    # -- list+watch loop ----------------------------------------------------
+
+    def _run(self):
+        while True:
+            k8s = get_k8s_client()
+            if k8s is None:
+                time.sleep(5)
+                continue
+            try:
+                # resource_version="0" serves the LIST from the apiserver
+                # watch cache instead of a quorum read from etcd; the watch
+                # below picks up from the returned resourceVersion anyway.
+                listing = k8s.list_namespaced_pod(
+                    namespace=DECOY_NAMESPACE,
+                    label_selector="role=decoy",
+                    resource_version="0",
+                    _request_timeout=K8S_REQUEST_TIMEOUT,
+                )
+                self._replace_all(listing.items)
+                self._synced.set()
+
+                w = watch.Watch()
+                try:
+                    for ev in w.stream(
+                        k8s.list_namespaced_pod,
+                        namespace=DECOY_NAMESPACE,
+                        label_selector="role=decoy",
+                        resource_version=listing.metadata.resource_version,
+                        allow_watch_bookmarks=True,
+                        timeout_seconds=300,
+                    ):
+                        if ev["type"] == "BOOKMARK":
+                            continue
+                        pod = ev["object"]
+                        if ev["type"] == "DELETED":
+                            self._drop(pod.metadata.name)
+                        else:
+                            self._set(pod)
+                finally:
+                    w.stop()
+                # Stream timed out normally — loop around and relist
+            except ApiException as e:
+                if e.status == 410:
+                    root_logger.info("Pod cache watch expired (410 Gone), relisting")
+                else:
+                    root_logger.warning(
+                        f"Pod cache watch error: {e.status}, relisting in 5s"
+                    )
+                    time.sleep(5)
+            except Exception as e:
+                root_logger.error(f"Pod cache loop error: {e}, retrying in 5s")
+                time.sleep(5)
+
+    # -- read API (in-memory, no apiserver round-trip) ----------------------
+
+    def active_attack_ids(self):
+        with self._lock:
+            return set(self._by_attack_id)
+
+    def pod_count(self):
+        with self._lock:
+            return len(self._pods)
+
+    def attack_for_ip(self, safe_ip):
+        with self._lock:
+            for name in self._by_attacker_ip.get(safe_ip, ()):
+                aid = (self._pods[name].metadata.labels or {}).get("attack-id", "")
+                if aid:
+                    return aid
+        return None
+
+    def pods_for_attack(self, attack_id_short):
+        with self._lock:
+            return [
+                self._pods[name]
+                for name in self._by_attack_id.get(attack_id_short, ())
+            ]
+
+    def oldest_attack_set(self):
+        # Single pass tracking the best (created, attack-id) pair — no
+        # intermediate per-set dict plus min() re-scan. ISO-8601 strings
+        # compare correctly lexicographically.
+        best_aid = None
+        best_created = None
+        with self._lock:
+            for pod in self._pods.values():
+                aid = (pod.metadata.labels or {}).get("attack-id", "")
+                created = (pod.metadata.annotations or {}).get(
+                    "deception-system/created-at", ""
+                )
+                if aid and created and (best_created is None or created < best_created):
+                    best_aid, best_created = aid, created
+        return best_aid
+
+    def snapshot(self):
+        with self._lock:
+            return list(self._pods.values())
+
+
+_pod_cache = _DecoyPodCache()
+
+
 # ============================================================================
 # Core: Decoy spawning logic
 # ============================================================================
@@ -175,107 +465,50 @@ def publish_event(channel, event):
 
 def _get_active_attack_ids():
     """Return set of short attack-ids that currently have pods in decoy-pool."""
-    k8s = get_k8s_client()
-    if k8s is None:
-        return set()
-    try:
-        pods = k8s.list_namespaced_pod(
-            namespace=DECOY_NAMESPACE,
-            label_selector="role=decoy",
-        )
-        ids = set()
-        for pod in pods.items:
-            aid = pod.metadata.labels.get("attack-id", "")
-            if aid:
-                ids.add(aid)
-        return ids
-    except ApiException as e:
-        root_logger.error(f"Failed to list pods: {e.status} {e.reason}")
+    if not _pod_cache.wait_synced():
         return set()
+    return _pod_cache.active_attack_ids()
 
 
 def _get_decoy_pod_count():
     """Return the current number of decoy pods in decoy-pool."""
-    k8s = get_k8s_client()
-    if k8s is None:
-        return 0
-    try:
-        pods = k8s.list_namespaced_pod(
-            namespace=DECOY_NAMESPACE,
-            label_selector="role=decoy",
-        )
-        return len(pods.items)
-    except ApiException as e:
-        root_logger.error(f"Failed to count pods: {e.status} {e.reason}")
+    if not _pod_cache.wait_synced():
         return 0
+    return _pod_cache.pod_count()
 
 
-def _has_existing_decoys_for_ip(attacker_ip):
-    """Check if decoys already exist for a given attacker IP."""
-    safe_ip = attacker_ip.replace(":", "-")
-    k8s = get_k8s_client()
-    if k8s is None:
-        return False
-    try:
-        pods = k8s.list_namespaced_pod(
-            namespace=DECOY_NAMESPACE,
-            label_selector=f"role=decoy,attacker-ip={safe_ip}",
-        )
-        return len(pods.items) > 0
-    except ApiException as e:
-        root_logger.error(f"Failed to check existing decoys: {e.status} {e.reason}")
-        return False
-
+def _lookup_existing_attack_for_ip(attacker_ip):
+    """Return the short attack-id of existing decoys for an IP, or None.
 
-def _get_existing_attack_short_for_ip(attacker_ip):
-    """Return existing short attack-id for a given attacker IP, or None."""
-    safe_ip = attacker_ip.replace(":", "-")
-    k8s = get_k8s_client()
-    if k8s is None:
+    Single lookup answering both "do decoys exist?" and "which set?" —
+    callers branch on the returned value instead of asking twice.
+    """
+    safe_ip = sanitize_ip(attacker_ip)
+    if not _pod_cache.wait_synced():
         return None
-    try:
-        pods = k8s.list_namespaced_pod(
-            namespace=DECOY_NAMESPACE,
-            label_selector=f"role=decoy,attacker-ip={safe_ip}",
-        )
-        for pod in pods.items:
-            attack_short = (pod.metadata.labels or {}).get("attack-id", "")
-            if attack_short:
-                return attack_short
-    except ApiException as e:
-        root_logger.error(
-            f"Failed to resolve attack-id for IP {attacker_ip}: {e.status}"
-        )
-    return None
+    return _pod_cache.attack_for_ip(safe_ip)
+
+
+def _pod_is_ready(pod):
+    """True when a pod is Running and its Ready condition is True."""
+    if pod.status is None or pod.status.phase != "Running":
+        return False
+    for cond in pod.status.conditions or ():
+        if cond.type == "Ready":
+            return cond.status == "True"
+    return False
 
 
 def _is_attack_set_ready(attack_id_short):
     """Return True when all pods in a decoy set report Ready=True."""
     if not attack_id_short:
         return False
-    k8s = get_k8s_client()
-    if k8s is None:
+    if not _pod_cache.wait_synced():
         return False
-    try:
-        pods = k8s.list_namespaced_pod(
-            namespace=DECOY_NAMESPACE,
-            label_selector=f"role=decoy,attack-id={attack_id_short}",
-        )
-        if not pods.items:
-            return False
-        for pod in pods.items:
-            if pod.status.phase != "Running":
-                return False
-            conditions = pod.status.conditions or []
-            ready_cond = next((c for c in conditions if c.type == "Ready"), None)
-            if ready_cond is None or ready_cond.status != "True":
-                return False
-        return True
-    except ApiException as e:
-        root_logger.error(
-            f"Failed readiness check for attack-id {attack_id_short}: {e.status}"
-        )
+    pods = _pod_cache.pods_for_attack(attack_id_short)
+    if not pods:
         return False
+    return all(_pod_is_ready(pod) for pod in pods)
 
 
 def _find_oldest_attack_set():
@@ -284,35 +517,20 @@ def _find_oldest_attack_set():
 
     Returns the short attack-id of the oldest set, or None.
     """
-    k8s = get_k8s_client()
-    if k8s is None:
-        return None
-    try:
-        pods = k8s.list_namespaced_pod(
-            namespace=DECOY_NAMESPACE,
-            label_selector="role=decoy",
-        )
-        # Group by attack-id, find the oldest created-at
-        sets = {}
-        for pod in pods.items:
-            aid = pod.metadata.labels.get("attack-id", "")
-            created = pod.metadata.annotations.get("deception-system/created-at", "")
-            if aid and created:
-                if aid not in sets or created < sets[aid]:
-                    sets[aid] = created
-        if not sets:
-            return None
-        # Return the attack-id with the earliest created-at
-        return min(sets, key=sets.get)
-    except ApiException as e:
-        root_logger.error(f"Failed to find oldest set: {e.status} {e.reason}")
+    if not _pod_cache.wait_synced():
         return None
+    return _pod_cache.oldest_attack_set()
 
 
 def _delete_decoy_set(attack_id_short):
     """
     Delete all pods and services for a given attack-id.
 
+    One DeleteCollection call per resource kind on the attack-id label
+    replaces the old LIST plus per-object delete sequence (up to 8 serial
+    round-trips for a full set). Background propagation with zero grace
+    keeps the call from blocking the synchronous eviction path.
+
     Returns the count of resources deleted.
     """
     k8s = get_k8s_client()
@@ -321,49 +539,27 @@ def _delete_decoy_set(attack_id_short):
     deleted = 0
     label_sel = f"role=decoy,attack-id={attack_id_short}"
 
-    try:
-        # Delete pods
-        pods = k8s.list_namespaced_pod(
-            namespace=DECOY_NAMESPACE,
-            label_selector=label_sel,
-        )
-        for pod in pods.items:
-            try:
-                k8s.delete_namespaced_pod(
-                    name=pod.metadata.name,
-                    namespace=DECOY_NAMESPACE,
-                )
-                root_logger.info(
-                    f"Deleted pod {pod.metadata.name} (attack-id={attack_id_short})"
-                )
-                deleted += 1
-            except ApiException as e:
-                root_logger.warning(
-                    f"Failed to delete pod {pod.metadata.name}: {e.status}"
-                )
-
-        # Delete services
-        services = k8s.list_namespaced_service(
-            namespace=DECOY_NAMESPACE,
-            label_selector=label_sel,
-        )
-        for svc in services.items:
-            try:
-                k8s.delete_namespaced_service(
-                    name=svc.metadata.name,
-                    namespace=DECOY_NAMESPACE,
-                )
-                root_logger.info(
-                    f"Deleted service {svc.metadata.name} (attack-id={attack_id_short})"
-                )
-                deleted += 1
-            except ApiException as e:
-                root_logger.warning(
-                    f"Failed to delete service {svc.metadata.name}: {e.status}"
-                )
-
-    except ApiException as e:
-        root_logger.error(f"Failed to list resources for deletion: {e.status}")
+    for kind, delete_collection in (
+        ("pod", k8s.delete_collection_namespaced_pod),
+        ("service", k8s.delete_collection_namespaced_service),
+    ):
+        try:
+            result = delete_collection(
+                namespace=DECOY_NAMESPACE,
+                label_selector=label_sel,
+                propagation_policy="Background",
+                grace_period_seconds=0,
+                _request_timeout=K8S_REQUEST_TIMEOUT,
+            )
+            count = len(getattr(result, "items", None) or [])
+            deleted += count
+            root_logger.info(
+                f"Deleted {count} {kind}(s) (attack-id={attack_id_short})"
+            )
+        except ApiException as e:
+            root_logger.warning(
+                f"Failed to delete {kind}s for attack-id={attack_id_short}: {e.status}"
+            )
 
     # Remove from tracking state
     with stats_lock:
@@ -372,9 +568,36 @@ def _delete_decoy_set(attack_id_short):
     return deleted
 
 
-def _wait_for_pods_running(pod_names, timeout=POD_READY_TIMEOUT):
+def _is_quota_error(e):
+    """
+    True if an ApiException is a namespace quota rejection.
+
+    Parses the machine-readable Status body instead of substring-matching the
+    whole exception text: the status/reason fields are stable across apiserver
+    versions and message phrasing, and the JSON parse only happens on the rare
+    403 path. Falls back to the old substring check if the body isn't JSON.
+    """
+    if e.status != 403:
+        return False
+    try:
+        body = orjson.loads(e.body)
+    except (TypeError, ValueError):
+        return "exceeded quota" in (e.body or "")
+    return (
+        body.get("reason") == "Forbidden"
+        and "quota" in body.get("message", "").lower()
+    )
+
+
+def _wait_for_pods_running(pod_names, attack_id_short, timeout=POD_READY_TIMEOUT):
     """
-    Poll until all named pods are Ready (running + containers ready).
+    Block until all named pods are Ready, using a watch instead of polling.
+
+    One long-lived watch on the attack-id label replaces the old 2-second
+    read_namespaced_pod loop: readiness is detected as soon as the apiserver
+    sees the status change, and steady-state polling traffic disappears.
+    The stream's initial events replay current pod state, so pods that were
+    already Ready before the watch opened are not missed.
 
     Returns True if all pods are Ready, False on timeout.
     """
@@ -382,31 +605,35 @@ def _wait_for_pods_running(pod_names, timeout=POD_READY_TIMEOUT):
     if k8s is None:
         return False
 
+    wanted = set(pod_names)
+    ready = set()
+    label_sel = f"role=decoy,attack-id={attack_id_short}"
     deadline = time.monotonic() + timeout
+
     while time.monotonic() < deadline:
-        all_running = True
-        for name in pod_names:
-            try:
-                pod = k8s.read_namespaced_pod(
-                    name=name,
-                    namespace=DECOY_NAMESPACE,
-                )
-                if pod.status.phase != "Running":
-                    all_running = False
-                    break
-
-                conditions = pod.status.conditions or []
-                ready_cond = next((c for c in conditions if c.type == "Ready"), None)
-                if ready_cond is None or ready_cond.status != "True":
-                    all_running = False
-                    break
-            except ApiException:
-                all_running = False
-                break
-
-        if all_running:
-            return True
-        time.sleep(2)
+        remaining = max(1, int(deadline - time.monotonic()))
+        w = watch.Watch()
+        try:
+            for ev in w.stream(
+                k8s.list_namespaced_pod,
+                namespace=DECOY_NAMESPACE,
+                label_selector=label_sel,
+                timeout_seconds=remaining,
+            ):
+                pod = ev["object"]
+                name = pod.metadata.name
+                if ev["type"] == "DELETED":
+                    ready.discard(name)
+                    continue
+                if name in wanted and _pod_is_ready(pod):
+                    ready.add(name)
+                    if ready >= wanted:
+                        return True
+        except ApiException as e:
+            root_logger.warning(f"Pod watch interrupted: {e.status}, retrying")
+            time.sleep(1)
+        finally:
+            w.stop()
 
     return False
 
@@ -430,23 +657,12 @@ def handle_attack_event(event_data):
     )
 
     # --- Check for duplicate: already have decoys for this IP ---
-    if _has_existing_decoys_for_ip(source_ip):
+    existing_short = _lookup_existing_attack_for_ip(source_ip)
+    if existing_short:
         root_logger.info(f"Decoys already exist for IP {source_ip}, skipping")
-        existing_short = _get_existing_attack_short_for_ip(source_ip)
-        if existing_short and _is_attack_set_ready(existing_short):
+        if _is_attack_set_ready(existing_short):
             # Re-publish route in case router restarted or initial route publish was skipped.
-            publish_event(
-                CH_ROUTING_UPDATE,
-                {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "type": "add_route",
-                    "attacker_ip": source_ip,
-                    "attack_id": existing_short,
-                    "frontend_service": f"decoy-fe-{existing_short}.{DECOY_NAMESPACE}.svc.cluster.local:3000",
-                    "api_service": f"decoy-api-{existing_short}.{DECOY_NAMESPACE}.svc.cluster.local:8081",
-                    "db_service": f"decoy-db-{existing_short}.{DECOY_NAMESPACE}.svc.cluster.local:5432",
-                },
-            )
+            publish_event(*_add_route_event(source_ip, existing_short, existing_short))
             root_logger.info(
                 f"Re-published route for existing decoys: ip={source_ip} attack={existing_short}"
             )
@@ -455,6 +671,9 @@ def handle_attack_event(event_data):
         return
 
     # --- Resource guard: evict oldest if at capacity ---
+    # O(1) read from the pod cache — no LIST round-trip per event. The
+    # cache's watch stream keeps the count honest, so no separate counter
+    # reconciliation is needed.
     current_count = _get_decoy_pod_count()
     if current_count >= MAX_DECOY_PODS - 2:
         # Need room for 3 new pods; evict the oldest set
@@ -467,7 +686,7 @@ def handle_attack_event(event_data):
             publish_event(
                 CH_DECOY_SPAWNED,
                 {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": _now_iso(),
                     "type": "decoy_evicted",
                     "attack_id": oldest,
                     "reason": "capacity_limit",
@@ -489,32 +708,45 @@ def handle_attack_event(event_data):
     created_pods = []
     created_services = []
     quota_failure = False
+    results_lock = threading.Lock()
 
-    for resource in resources:
+    def _create_resource(resource):
+        """Create one pod/service; runs on the creation thread pool."""
+        nonlocal quota_failure
         kind = resource.get("kind", "")
         name = resource["metadata"]["name"]
-
         try:
             if kind == "Pod":
                 k8s.create_namespaced_pod(
                     namespace=DECOY_NAMESPACE,
                     body=resource,
+                    _request_timeout=K8S_REQUEST_TIMEOUT,
                 )
-                created_pods.append(name)
+                with results_lock:
+                    created_pods.append(name)
                 root_logger.info(f"Created pod: {name}")
             elif kind == "Service":
                 k8s.create_namespaced_service(
                     namespace=DECOY_NAMESPACE,
                     body=resource,
+                    _request_timeout=K8S_REQUEST_TIMEOUT,
                 )
-                created_services.append(name)
+                with results_lock:
+                    created_services.append(name)
                 root_logger.info(f"Created service: {name}")
         except ApiException as e:
             root_logger.error(
                 f"Failed to create {kind} {name}: {e.status} {e.reason} — {e.body}"
             )
-            if e.status == 403 and "exceeded quota" in str(e.body):
-                quota_failure = True
+            if _is_quota_error(e):
+                with results_lock:
+                    quota_failure = True
+
+    # Dispatch all 6 creates concurrently — wall-clock becomes the slowest
+    # single round-trip instead of the sum, which matters because the route
+    # publish below is gated on pod readiness of the whole set.
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(_create_resource, resources))
 
     if quota_failure and len(created_pods) < 3:
         root_logger.warning(
@@ -529,7 +761,9 @@ def handle_attack_event(event_data):
 
     # --- Wait for pods to be Ready ---
     root_logger.info(f"Waiting for {len(created_pods)} pods to reach Ready state...")
-    pods_ready = _wait_for_pods_running(created_pods, timeout=POD_READY_TIMEOUT)
+    pods_ready = _wait_for_pods_running(
+        created_pods, attack_id[:8], timeout=POD_READY_TIMEOUT
+    )
     if pods_ready:
         root_logger.info(f"All decoy pods ready for attack {attack_id[:8]}")
     else:
@@ -546,41 +780,38 @@ def handle_attack_event(event_data):
             "attack_id": attack_id,
             "attacker_ip": source_ip,
             "attack_type": attack_type,
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": _now_iso(),
             "pods": created_pods,
             "services": created_services,
             "pods_ready": pods_ready,
         }
 
-    # --- Publish decoy_spawned event ---
-    publish_event(
-        CH_DECOY_SPAWNED,
-        {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "type": "decoy_spawned",
-            "attack_id": attack_id,
-            "attacker_ip": source_ip,
-            "attack_type": attack_type,
-            "decoy_pods": created_pods,
-            "decoy_services": created_services,
-            "pods_ready": pods_ready,
-        },
-    )
+    # --- Schedule TTL-based deletion ---
+    _schedule_ttl(short_id, time.time() + DEFAULT_TTL_MINUTES * 60)
 
-    # --- Notify traffic-router to redirect this IP only when decoys are Ready ---
-    if pods_ready:
-        publish_event(
-            CH_ROUTING_UPDATE,
+    # --- Publish decoy_spawned (and, when Ready, the routing update) in
+    # --- one pipelined round-trip
+    events = [
+        (
+            CH_DECOY_SPAWNED,
             {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "type": "add_route",
-                "attacker_ip": source_ip,
+                "timestamp": _now_iso(),
+                "type": "decoy_spawned",
                 "attack_id": attack_id,
-                "frontend_service": f"decoy-fe-{short_id}.{DECOY_NAMESPACE}.svc.cluster.local:3000",
-                "api_service": f"decoy-api-{short_id}.{DECOY_NAMESPACE}.svc.cluster.local:8081",
-                "db_service": f"decoy-db-{short_id}.{DECOY_NAMESPACE}.svc.cluster.local:5432",
+                "attacker_ip": source_ip,
+                "attack_type": attack_type,
+                "decoy_pods": created_pods,
+                "decoy_services": created_services,
+                "pods_ready": pods_ready,
             },
         )
+    ]
+
+    # Only redirect this IP once decoys are Ready (avoids 502s)
+    if pods_ready:
+        events.append(_add_route_event(source_ip, attack_id, short_id))
+
+    publish_events(events)
 
     root_logger.info(
         f"Decoy set complete: attack={short_id} ip={source_ip} "
@@ -593,81 +824,175 @@ def handle_attack_event(event_data):
 # ============================================================================
 
 
+# Expiry queue: creation pushes (expiry_ts, attack_id_short) and the
+# cleanup thread sleeps until the earliest entry is due, instead of
+# re-scanning every pod each minute.
+_ttl_heap = []
+_ttl_cv = threading.Condition()
+
+
+def _schedule_ttl(attack_id_short, expiry_ts):
+    """Queue a decoy set for deletion at the given unix timestamp."""
+    with _ttl_cv:
+        heapq.heappush(_ttl_heap, (expiry_ts, attack_id_short))
+        _ttl_cv.notify()
+
+
+def _reconcile_ttl_heap():
+    """Re-seed the expiry heap from pod annotations.
+
+    The annotations are the source of truth, so this recovers schedules
+    lost across a controller restart. Reads the pod cache only — no
+    apiserver round-trip.
+    """
+    if not _pod_cache.wait_synced():
+        return
+    entries = {}
+    for pod in _pod_cache.snapshot():
+        annotations = pod.metadata.annotations or {}
+        created_str = annotations.get("deception-system/created-at", "")
+        ttl_str = annotations.get("deception-system/ttl-minutes", "10")
+        attack_id_short = (pod.metadata.labels or {}).get("attack-id", "")
+        if not created_str or not attack_id_short:
+            continue
+        try:
+            expiry = datetime.fromisoformat(created_str).timestamp() + int(ttl_str) * 60
+        except (ValueError, TypeError):
+            continue
+        if attack_id_short not in entries or expiry < entries[attack_id_short]:
+            entries[attack_id_short] = expiry
+    with _ttl_cv:
+        scheduled = {aid for _, aid in _ttl_heap}
+        for attack_id_short, expiry in entries.items():
+            if attack_id_short not in scheduled:
+                heapq.heappush(_ttl_heap, (expiry, attack_id_short))
+        _ttl_cv.notify()
+
+
+def _expire_attack_set(attack_id_short):
+    """Delete a due decoy set and publish the expiry events."""
+    if not _pod_cache.pods_for_attack(attack_id_short):
+        # Already evicted or cleaned up before its TTL came due
+        return
+
+    root_logger.info(f"TTL expired for attack set {attack_id_short}, cleaning up")
+    deleted = _delete_decoy_set(attack_id_short)
+
+    # Deletion event plus router route removal, pipelined together
+    publish_events(
+        [
+            (
+                CH_DECOY_SPAWNED,
+                {
+                    "timestamp": _now_iso(),
+                    "type": "decoy_expired",
+                    "attack_id": attack_id_short,
+                    "resources_deleted": deleted,
+                    "reason": "ttl_expired",
+                },
+            ),
+            (
+                CH_ROUTING_UPDATE,
+                {
+                    "timestamp": _now_iso(),
+                    "type": "remove_route",
+                    "attack_id": attack_id_short,
+                    "reason": "ttl_expired",
+                },
+            ),
+        ]
+    )
+
+    with stats_lock:
+        controller_stats["total_cleaned_sets"] += 1
+
+
 def _ttl_cleanup():
     """
-    Check all decoy pods for TTL expiry and delete expired sets.
+    Delete decoy sets as their TTLs come due.
 
-    Runs every TTL_CHECK_INTERVAL seconds in a background thread.
+    Event-driven: sleeps on the expiry heap until the earliest entry is
+    due (O(log n) per expiry) rather than scanning all pods every
+    TTL_CHECK_INTERVAL. A periodic reconciliation pass re-seeds the heap
+    from annotations to recover after restarts.
     """
+    next_reconcile = 0.0  # reconcile immediately at startup
     while True:
-        time.sleep(TTL_CHECK_INTERVAL)
         try:
-            k8s = get_k8s_client()
-            if k8s is None:
-                continue
+            now = time.time()
+            if now >= next_reconcile:
+                _reconcile_ttl_heap()
+                next_reconcile = now + TTL_RECONCILE_INTERVAL
+
+            with _ttl_cv:
+                timeout = next_reconcile - time.time()
+                if _ttl_heap:
+                    timeout = min(timeout, _ttl_heap[0][0] - time.time())
+                if timeout > 0:
+                    _ttl_cv.wait(timeout)
+                if not _ttl_heap or _ttl_heap[0][0] > time.time():
+                    continue
+                _, attack_id_short = heapq.heappop(_ttl_heap)
 
-            pods = k8s.list_namespaced_pod(
-                namespace=DECOY_NAMESPACE,
-                label_selector="role=decoy",
-            )
+            _expire_attack_set(attack_id_short)
+        except Exception as e:
+            root_logger.error(f"TTL cleanup error: {e}")
+            time.sleep(5)
 
-            now = datetime.now(timezone.utc)
-            expired_sets = set()
 
-            for pod in pods.items:
-                annotations = pod.metadata.annotations or {}
-                created_str = annotations.get("deception-system/created-at", "")
-                ttl_str = annotations.get("deception-system/ttl-minutes", "10")
-                attack_id_short = pod.metadata.labels.get("attack-id", "")
+# ============================================================================
+# Attack handler pool
+# ============================================================================
 
-                if not created_str or not attack_id_short:
-                    continue
+# handle_attack_event can block for up to POD_READY_TIMEOUT waiting on pod
+# readiness. Running it inline in the subscriber loop would stall every
+# later Redis message behind one slow spawn, so handling happens on a
+# bounded pool and the listener stays drained.
+_HANDLER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="attack-handler")
+_MAX_IN_FLIGHT = 16
 
-                try:
-                    created_at = datetime.fromisoformat(created_str)
-                    ttl_minutes = int(ttl_str)
-                    age_minutes = (now - created_at).total_seconds() / 60.0
+_inflight_sem = threading.Semaphore(_MAX_IN_FLIGHT)
+_inflight_ips = set()
+_inflight_lock = threading.Lock()
 
-                    if age_minutes > ttl_minutes:
-                        expired_sets.add(attack_id_short)
-                except (ValueError, TypeError):
-                    continue
 
-            # Delete each expired set
-            for attack_id_short in expired_sets:
-                root_logger.info(
-                    f"TTL expired for attack set {attack_id_short}, cleaning up"
-                )
-                deleted = _delete_decoy_set(attack_id_short)
-
-                # Publish deletion event
-                publish_event(
-                    CH_DECOY_SPAWNED,
-                    {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "type": "decoy_expired",
-                        "attack_id": attack_id_short,
-                        "resources_deleted": deleted,
-                        "reason": "ttl_expired",
-                    },
-                )
+def _dispatch_attack_event(event_data):
+    """Hand an attack event to the handler pool without blocking.
 
-                # Notify traffic-router to remove routing rule
-                publish_event(
-                    CH_ROUTING_UPDATE,
-                    {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "type": "remove_route",
-                        "attack_id": attack_id_short,
-                        "reason": "ttl_expired",
-                    },
-                )
+    Events for an IP whose handler is still in flight are dropped up front
+    (the duplicate check inside handle_attack_event would race against the
+    not-yet-created pods), and events beyond the in-flight cap are dropped
+    with a warning instead of queueing without bound.
+    """
+    source_ip = event_data.get("source_ip", "unknown")
+
+    with _inflight_lock:
+        if source_ip in _inflight_ips:
+            root_logger.info(
+                f"Handler already in flight for IP {source_ip}, dropping event"
+            )
+            return
+        _inflight_ips.add(source_ip)
 
-                with stats_lock:
-                    controller_stats["total_cleaned_sets"] += 1
+    if not _inflight_sem.acquire(blocking=False):
+        with _inflight_lock:
+            _inflight_ips.discard(source_ip)
+        root_logger.warning(
+            f"Attack handler backlog full ({_MAX_IN_FLIGHT} in flight), dropping event"
+        )
+        return
 
+    def _run():
+        try:
+            handle_attack_event(event_data)
         except Exception as e:
-            root_logger.error(f"TTL cleanup error: {e}")
+            root_logger.error(f"Error handling attack event: {e}")
+        finally:
+            with _inflight_lock:
+                _inflight_ips.discard(source_ip)
+            _inflight_sem.release()
+
+    _HANDLER_POOL.submit(_run)
 
 
 # ============================================================================
@@ -679,38 +1004,40 @@ def _redis_subscriber_loop():
     """
     Subscribe to the attack_detected Redis channel and process events.
 
-    Reconnects automatically if the connection drops.
+    Reconnects automatically if the connection drops, backing off
+    exponentially (1s doubling to 30s) while Redis stays down so a long
+    outage doesn't turn into a tight reconnect spin.
     """
+    backoff = 1.0
     while True:
         try:
-            sub_client = redis.from_url(
-                REDIS_URL,
-                socket_connect_timeout=5,
-                socket_timeout=None,  # blocking subscribe
-            )
+            sub_client = redis.Redis(connection_pool=_REDIS_POOL)
             pubsub = sub_client.pubsub()
             pubsub.subscribe(CH_ATTACK_DETECTED)
             root_logger.info(f"Subscribed to Redis channel '{CH_ATTACK_DETECTED}'")
+            backoff = 1.0
 
             for message in pubsub.listen():
                 if message["type"] != "message":
                     continue
                 try:
-                    data = json.loads(message["data"])
-                    handle_attack_event(data)
-                except json.JSONDecodeError as e:
+                    data = orjson.loads(message["data"])
+                    _dispatch_attack_event(data)
+                except orjson.JSONDecodeError as e:
                     root_logger.warning(f"Invalid JSON from Redis: {e}")
                 except Exception as e:
-                    root_logger.error(f"Error handling attack event: {e}")
+                    root_logger.error(f"Error dispatching attack event: {e}")
 
         except redis.RedisError as e:
             root_logger.warning(
-                f"Redis subscriber disconnected: {e}, reconnecting in 5s..."
+                f"Redis subscriber disconnected: {e}, reconnecting in {backoff:.0f}s..."
             )
-            time.sleep(5)
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
         except Exception as e:
-            root_logger.error(f"Subscriber loop error: {e}, retrying in 5s...")
-            time.sleep(5)
+            root_logger.error(f"Subscriber loop error: {e}, retrying in {backoff:.0f}s...")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
 
 
 # ============================================================================
@@ -733,14 +1060,14 @@ def after_request(response):
         (time.monotonic() - g.get("start_time", time.monotonic())) * 1000, 2
     )
     log_entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _now_iso(),
         "method": request.method,
         "path": request.path,
         "source_ip": request.remote_addr,
         "response_code": response.status_code,
         "duration_ms": duration_ms,
     }
-    app.logger.info(json.dumps(log_entry))
+    app.logger.info(orjson.dumps(log_entry).decode())
     return response
 
 
@@ -749,8 +1076,8 @@ def after_request(response):
 # ---------------------------------------------------------------------------
 @app.route("/status")
 def status():
-    """Return current decoy controller state."""
-    pod_count = _get_decoy_pod_count()
+    """Return current decoy controller state (in-memory reads only)."""
+    pod_count = _get_decoy_pod_count()  # pod cache, no apiserver call
     with stats_lock:
         return jsonify(
             {
@@ -767,10 +1094,7 @@ def status():
                 "decoy_namespace": DECOY_NAMESPACE,
                 "started_at": controller_stats["started_at"],
                 "uptime_seconds": round(
-                    (
-                        datetime.now(timezone.utc)
-                        - datetime.fromisoformat(controller_stats["started_at"])
-                    ).total_seconds()
+                    (datetime.now(timezone.utc) - STARTED_AT).total_seconds()
                 ),
             }
         )
@@ -808,7 +1132,10 @@ def health():
 
 
 def start_background_threads():
-    """Launch the Redis subscriber and TTL cleanup threads."""
+    """Launch the pod cache, Redis subscriber and TTL cleanup threads."""
+    _pod_cache.ensure_started()
+    root_logger.info("Pod cache (informer) thread started")
+
     subscriber_thread = threading.Thread(
         target=_redis_subscriber_loop,
         daemon=True,
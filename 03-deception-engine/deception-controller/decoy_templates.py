@@ -10,7 +10,9 @@ All resources are created in the decoy-pool namespace with labels that
 tie them to a specific attack event, enabling bulk cleanup by attack-id.
 """
 
+import copy
 import os
+from functools import lru_cache
 from datetime import datetime, timezone
 
 # ---------------------------------------------------------------------------
@@ -28,6 +30,19 @@ DEFAULT_TTL_MINUTES = int(os.environ.get("DECOY_TTL_MINUTES", "10"))
 # ============================================================================
 
 
+@lru_cache(maxsize=4096)
+def sanitize_ip(attacker_ip):
+    """
+    Sanitise an attacker IP for use in label values (dots are allowed,
+    colons from IPv6 are not — replace with dashes).
+
+    Memoised: the same handful of attacker IPs recur across the spawn,
+    duplicate-lookup and template paths, so repeat sanitisations are a
+    dict hit instead of a string scan + copy.
+    """
+    return attacker_ip.replace(":", "-")
+
+
 def create_decoy_set(attack_id, attacker_ip, attack_type):
     """
     Generate a complete decoy set (3 pods + 3 services) for an attack event.
@@ -50,97 +65,19 @@ def create_decoy_set(attack_id, attacker_ip, attack_type):
     short_id = attack_id[:8]
     now = datetime.now(timezone.utc).isoformat()
 
-    # Sanitise attacker_ip for use in label values (dots are allowed, colons
-    # from IPv6 are not — replace with dashes)
-    safe_ip = attacker_ip.replace(":", "-")
+    safe_ip = sanitize_ip(attacker_ip)
 
     resources = []
-
-    # --- Decoy Frontend (port 3000) ---
-    fe_name = f"decoy-fe-{short_id}"
-    resources.append(
-        _make_pod(
-            name=fe_name,
-            image="deception/decoy-frontend:latest",
-            port=3000,
-            attack_id=attack_id,
-            attacker_ip=safe_ip,
-            attack_type=attack_type,
-            decoy_type="frontend",
-            created_at=now,
-            resources_limits={"memory": "96Mi", "cpu": "50m"},
-            resources_requests={"memory": "32Mi", "cpu": "25m"},
-            env_extra=[],
-        )
-    )
-    resources.append(
-        _make_service(
-            name=fe_name,
-            port=3000,
-            attack_id=attack_id,
-            attacker_ip=safe_ip,
-            decoy_type="frontend",
-        )
-    )
-
-    # --- Decoy API (port 8081) ---
-    api_name = f"decoy-api-{short_id}"
-    resources.append(
-        _make_pod(
-            name=api_name,
-            image="deception/decoy-api:latest",
-            port=8081,
-            attack_id=attack_id,
-            attacker_ip=safe_ip,
-            attack_type=attack_type,
-            decoy_type="api",
-            created_at=now,
-            resources_limits={"memory": "96Mi", "cpu": "50m"},
-            resources_requests={"memory": "32Mi", "cpu": "25m"},
-            env_extra=[],
+    for decoy_type, name_prefix in (
+        ("frontend", "decoy-fe"),
+        ("api", "decoy-api"),
+        ("database", "decoy-db"),
+    ):
+        name = f"{name_prefix}-{short_id}"
+        resources.append(
+            _instantiate_pod(decoy_type, name, attack_id, safe_ip, attack_type, now)
         )
-    )
-    resources.append(
-        _make_service(
-            name=api_name,
-            port=8081,
-            attack_id=attack_id,
-            attacker_ip=safe_ip,
-            decoy_type="api",
-        )
-    )
-
-    # --- Decoy DB (port 5432) ---
-    db_name = f"decoy-db-{short_id}"
-    resources.append(
-        _make_pod(
-            name=db_name,
-            image="deception/decoy-db:latest",
-            port=5432,
-            attack_id=attack_id,
-            attacker_ip=safe_ip,
-            attack_type=attack_type,
-            decoy_type="database",
-            created_at=now,
-            # DB gets more resources — postgres overhead
-            resources_limits={"memory": "64Mi", "cpu": "100m"},
-            resources_requests={"memory": "48Mi", "cpu": "50m"},
-            env_extra=[
-                {"name": "POSTGRES_DB", "value": "ecommerce"},
-                {"name": "POSTGRES_USER", "value": "appuser"},
-                {"name": "POSTGRES_PASSWORD", "value": "d3c0y-Tr4p-2024"},
-            ],
-        )
-    )
-    resources.append(
-        _make_service(
-            name=db_name,
-            port=5432,
-            attack_id=attack_id,
-            attacker_ip=safe_ip,
-            decoy_type="database",
-        )
-    )
+        resources.append(_instantiate_service(decoy_type, name, attack_id, safe_ip))
 
     return resources
 
@@ -296,3 +233,117 @@ def _make_service(name, port, attack_id, attacker_ip, decoy_type):
             ],
         },
     }
+
+
+# ============================================================================
+# Prebuilt templates — constant structure built once at import
+# ============================================================================
+# The bulk of every resource dict (image, ports, probes, resource limits,
+# standard env) never changes between attacks. Build one template per decoy
+# type at import time and deepcopy-plus-patch the identity fields per
+# attack, instead of re-allocating the full nested structure on the
+# synchronous event path.
+
+_POD_SPECS = {
+    "frontend": {
+        "image": "deception/decoy-frontend:latest",
+        "port": 3000,
+        "resources_limits": {"memory": "96Mi", "cpu": "50m"},
+        "resources_requests": {"memory": "32Mi", "cpu": "25m"},
+        "env_extra": [],
+    },
+    "api": {
+        "image": "deception/decoy-api:latest",
+        "port": 8081,
+        "resources_limits": {"memory": "96Mi", "cpu": "50m"},
+        "resources_requests": {"memory": "32Mi", "cpu": "25m"},
+        "env_extra": [],
+    },
+    "database": {
+        "image": "deception/decoy-db:latest",
+        "port": 5432,
+        # DB gets more resources — postgres overhead
+        "resources_limits": {"memory": "64Mi", "cpu": "100m"},
+        "resources_requests": {"memory": "48Mi", "cpu": "50m"},
+        "env_extra": [
+            {"name": "POSTGRES_DB", "value": "ecommerce"},
+            {"name": "POSTGRES_USER", "value": "appuser"},
+            {"name": "POSTGRES_PASSWORD", "value": "d3c0y-Tr4p-2024"},
+        ],
+    },
+}
+
+_POD_TEMPLATES = {
+    decoy_type: _make_pod(
+        name="",
+        image=spec["image"],
+        port=spec["port"],
+        attack_id="",
+        attacker_ip="",
+        attack_type="",
+        decoy_type=decoy_type,
+        created_at="",
+        resources_limits=spec["resources_limits"],
+        resources_requests=spec["resources_requests"],
+        env_extra=spec["env_extra"],
+    )
+    for decoy_type, spec in _POD_SPECS.items()
+}
+
+_SERVICE_TEMPLATES = {
+    decoy_type: _make_service(
+        name="",
+        port=spec["port"],
+        attack_id="",
+        attacker_ip="",
+        decoy_type=decoy_type,
+    )
+    for decoy_type, spec in _POD_SPECS.items()
+}
+
+
+def _instantiate_pod(decoy_type, name, attack_id, safe_ip, attack_type, created_at):
+    """Deepcopy the pod template for a decoy type and patch identity fields."""
+    short_id = attack_id[:8]
+    pod = copy.deepcopy(_POD_TEMPLATES[decoy_type])
+
+    meta = pod["metadata"]
+    meta["name"] = name
+    meta["labels"].update(
+        {"app": name, "attack-id": short_id, "attacker-ip": safe_ip}
+    )
+    meta["annotations"].update(
+        {
+            "deception-system/created-at": created_at,
+            "deception-system/attack-type": attack_type,
+            "deception-system/attack-id": attack_id,
+            "deception-system/attacker-ip": safe_ip,
+        }
+    )
+
+    container = pod["spec"]["containers"][0]
+    container["name"] = name
+    for env in container["env"]:
+        if env["name"] == "DECOY_ID":
+            env["value"] = f"{decoy_type}-{short_id}"
+        elif env["name"] == "ATTACK_ID":
+            env["value"] = attack_id
+        elif env["name"] == "ATTACKER_IP":
+            env["value"] = safe_ip
+
+    return pod
+
+
+def _instantiate_service(decoy_type, name, attack_id, safe_ip):
+    """Deepcopy the service template for a decoy type and patch identity fields."""
+    short_id = attack_id[:8]
+    svc = copy.deepcopy(_SERVICE_TEMPLATES[decoy_type])
+
+    meta = svc["metadata"]
+    meta["name"] = name
+    meta["labels"].update(
+        {"app": name, "attack-id": short_id, "attacker-ip": safe_ip}
+    )
+    svc["spec"]["selector"]["app"] = name
+
+    return svc
@@ -12,17 +12,20 @@ Endpoints:
     GET  /health         — Health check
 """
 
-import json
 import logging
 import os
+import queue
 import sys
 import threading
 import time
 from collections import defaultdict, deque
+from operator import attrgetter
 from datetime import datetime, timezone
 
+import orjson
 import redis
-from flask import Flask, g, jsonify, request
+from flask import Flask, Response, g, jsonify, request
+from flask.json.provider import JSONProvider
 
 from attack_patterns import AttackDetector
 
@@ -32,18 +35,58 @@ from attack_patterns import AttackDetector
 app = Flask(__name__)
 
 
+# ---------------------------------------------------------------------------
+# orjson everywhere — request parsing, responses, Redis payloads and log
+# lines all serialise with the Rust encoder instead of stdlib json (same
+# provider pattern as the ecommerce services).
+# ---------------------------------------------------------------------------
+class OrjsonProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app.json = OrjsonProvider(app)
+
+
+# ---------------------------------------------------------------------------
+# Cached wall-clock timestamp — attack events and log lines within the same
+# second share one ISO string instead of each paying for a datetime object
+# plus isoformat() (same pattern as the deception controller). The tuple
+# swap is GIL-atomic.
+# ---------------------------------------------------------------------------
+_now_iso_cache = (0, "")
+
+
+def _now_iso():
+    sec = int(time.time())
+    cached_sec, cached = _now_iso_cache
+    if sec != cached_sec:
+        cached = datetime.now(timezone.utc).isoformat()
+        globals()["_now_iso_cache"] = (sec, cached)
+    return cached
+
+
 # ---------------------------------------------------------------------------
 # Structured JSON logging to stdout (same pattern as product-service)
 # ---------------------------------------------------------------------------
 class JsonFormatter(logging.Formatter):
     def format(self, record):
         log_record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "level": record.levelname,
             "service": "traffic-analyzer",
             "message": record.getMessage(),
         }
-        return json.dumps(log_record)
+        # Structured fields passed via logger extra= (see after_request):
+        # serialization only happens here, i.e. only for records that
+        # actually pass the level/filter checks.
+        for key, value in record.__dict__.items():
+            if key.startswith("req_"):
+                log_record[key[4:]] = value
+        return orjson.dumps(log_record).decode()
 
 
 handler = logging.StreamHandler(sys.stdout)
@@ -73,18 +116,27 @@ CLEANUP_INTERVAL = 60
 # ---------------------------------------------------------------------------
 detector = AttackDetector()
 
+# Parsed once — /stats derives uptime from this without re-parsing ISO text
+STARTED_AT = datetime.now(timezone.utc)
+
 # Statistics counters
 stats = {
     "total_analyzed": 0,
     "total_attacks_detected": 0,
     "attacks_by_type": defaultdict(int),
-    "started_at": datetime.now(timezone.utc).isoformat(),
+    "publish_dropped": 0,
+    "started_at": STARTED_AT.isoformat(),
 }
 stats_lock = threading.Lock()
 
-# Circular buffer for recent attacks
+# Circular buffer for recent attacks, stored as orjson-encoded bytes:
+# events are serialized once on insertion and /recent-attacks concatenates
+# the stored bytes instead of re-walking 100 nested dicts per scrape.
+# CPython's deque is C-implemented and bounded, so append and list()
+# snapshots are single bytecode ops under the GIL — no lock needed. (The
+# stats dict keeps its lock: "+= 1" on a dict value is read-modify-write
+# and is NOT atomic.)
 recent_attacks = deque(maxlen=MAX_RECENT_ATTACKS)
-recent_lock = threading.Lock()
 
 # ---------------------------------------------------------------------------
 # Redis client (non-blocking — if Redis is down, analysis still works)
@@ -114,18 +166,52 @@ def get_redis():
         return None
 
 
+# ---------------------------------------------------------------------------
+# Batched publishing — /analyze enqueues and returns immediately; a worker
+# thread coalesces bursts into one pipelined round-trip (up to 100 events or
+# 10 ms of lingering, whichever comes first) instead of one RTT per event.
+# ---------------------------------------------------------------------------
+_publish_queue = queue.Queue(maxsize=10000)
+_PUBLISH_BATCH_MAX = 100
+_PUBLISH_LINGER = 0.01
+
+
 def publish_attack(attack_event):
-    """Publish an attack event to Redis. Fails silently."""
-    client = get_redis()
-    if client is None:
-        return
+    """Queue an attack event for publishing. Drops (and counts) on overflow."""
     try:
-        client.publish(REDIS_CHANNEL, json.dumps(attack_event))
-    except redis.RedisError as e:
-        app.logger.warning(f"Redis publish failed: {e}")
-        # Reset client so next call retries connection
-        global redis_client
-        redis_client = None
+        _publish_queue.put_nowait(attack_event)
+    except queue.Full:
+        with stats_lock:
+            stats["publish_dropped"] += 1
+
+
+def _publish_worker():
+    """Drain the publish queue in batches onto a non-transactional pipeline."""
+    global redis_client
+    while True:
+        events = [_publish_queue.get()]
+        deadline = time.monotonic() + _PUBLISH_LINGER
+        while len(events) < _PUBLISH_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                events.append(_publish_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        client = get_redis()
+        if client is None:
+            continue  # Redis down — analysis still works, events are dropped
+        try:
+            with client.pipeline(transaction=False) as pipe:
+                for event in events:
+                    pipe.publish(REDIS_CHANNEL, orjson.dumps(event))
+                pipe.execute()
+        except redis.RedisError as e:
+            app.logger.warning(f"Redis publish failed: {e}")
+            # Reset client so the next batch retries connection
+            redis_client = None
 
 
 # ---------------------------------------------------------------------------
@@ -141,8 +227,21 @@ def _cleanup_loop():
             pass  # never crash the cleanup thread
 
 
-_cleanup_thread = threading.Thread(target=_cleanup_loop, daemon=True)
-_cleanup_thread.start()
+def _start_background_threads():
+    """Start the publish and cleanup daemon threads.
+
+    Called at import and re-registered for gunicorn's fork: with
+    --preload the module is imported once in the master, and threads do
+    not survive fork(), so each worker must restart its own copies. The
+    compiled pattern tables stay shared copy-on-write; only the threads
+    (and the per-worker rate-tracking state they maintain) are per-process.
+    """
+    threading.Thread(target=_publish_worker, daemon=True).start()
+    threading.Thread(target=_cleanup_loop, daemon=True).start()
+
+
+_start_background_threads()
+os.register_at_fork(after_in_child=_start_background_threads)
 
 
 # ---------------------------------------------------------------------------
@@ -150,25 +249,30 @@ _cleanup_thread.start()
 # ---------------------------------------------------------------------------
 @app.before_request
 def start_timer():
-    g.start_time = time.monotonic()
+    g.start_time = time.monotonic_ns()
 
 
 @app.after_request
 def after_request(response):
     response.headers["X-Service-Node"] = "traffic-analyzer"
 
-    duration_ms = round(
-        (time.monotonic() - g.get("start_time", time.monotonic())) * 1000, 2
+    # Integer ns subtraction; one float divide at the end instead of
+    # float multiply + round() on every request
+    end_ns = time.monotonic_ns()
+    duration_ms = (end_ns - g.get("start_time", end_ns)) // 10_000 / 100
+
+    # Structured fields ride on the record; JSON encoding is deferred to
+    # JsonFormatter and skipped entirely if the record is filtered out.
+    app.logger.info(
+        "request",
+        extra={
+            "req_method": request.method,
+            "req_path": request.path,
+            "req_source_ip": request.remote_addr,
+            "req_response_code": response.status_code,
+            "req_duration_ms": duration_ms,
+        },
     )
-    log_entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "method": request.method,
-        "path": request.path,
-        "source_ip": request.remote_addr,
-        "response_code": response.status_code,
-        "duration_ms": duration_ms,
-    }
-    app.logger.info(json.dumps(log_entry))
     return response
 
 
@@ -216,24 +320,31 @@ def analyze():
     with stats_lock:
         stats["total_analyzed"] += 1
 
-    # Filter findings above confidence threshold
-    high_confidence = [f for f in findings if f["confidence"] > CONFIDENCE_THRESHOLD]
+    # Filter findings above confidence threshold (threshold in a local:
+    # global loads inside the loop cost a dict lookup each iteration)
+    threshold = CONFIDENCE_THRESHOLD
+    high_confidence = [f for f in findings if f.confidence > threshold]
 
     if high_confidence:
-        # Sort by confidence descending — the top finding drives the response
-        high_confidence.sort(key=lambda f: f["confidence"], reverse=True)
+        # Sort by confidence descending — the top finding drives the response.
+        # attrgetter is a C-level key function; skip sorting the common
+        # single-finding case entirely.
+        if len(high_confidence) > 1:
+            high_confidence.sort(key=attrgetter("confidence"), reverse=True)
         top = high_confidence[0]
 
         # Build the attack event for Redis
         attack_event = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "type": "attack_detected",
-            "attack_type": top["attack_type"],
-            "confidence": top["confidence"],
-            "source_ip": top["source_ip"],
-            "evidence": top["evidence"],
+            "attack_type": top.attack_type,
+            "confidence": top.confidence,
+            "source_ip": top.source_ip,
+            "evidence": top.evidence,
             "findings_count": len(high_confidence),
-            "all_findings": high_confidence,
+            # Findings are __slots__ records; dict conversion happens here,
+            # once, at the serialization boundary
+            "all_findings": [f.to_dict() for f in high_confidence],
             "request": {
                 "method": data.get("method"),
                 "path": data.get("path"),
@@ -249,20 +360,19 @@ def analyze():
         with stats_lock:
             stats["total_attacks_detected"] += 1
             for f in high_confidence:
-                stats["attacks_by_type"][f["attack_type"]] += 1
+                stats["attacks_by_type"][f.attack_type] += 1
 
-        # Store in recent attacks buffer
-        with recent_lock:
-            recent_attacks.append(attack_event)
+        # Store in recent attacks buffer, pre-serialized (GIL-atomic append)
+        recent_attacks.append(orjson.dumps(attack_event))
 
         return jsonify(
             {
                 "attack": True,
-                "type": top["attack_type"],
-                "confidence": top["confidence"],
+                "type": top.attack_type,
+                "confidence": top.confidence,
                 "action": "redirect_to_decoy",
                 "findings_count": len(high_confidence),
-                "top_finding": top,
+                "top_finding": top.to_dict(),
             }
         )
 
@@ -284,29 +394,33 @@ def analyze():
 @app.route("/stats")
 def get_stats():
     """Return aggregate detection statistics."""
+    # Snapshot the counters in O(1) under the lock, then release it before
+    # the derived math and tracking-state walk — stats scraping no longer
+    # serializes with /analyze counter updates.
     with stats_lock:
-        tracking = detector.get_tracking_stats()
-        return jsonify(
-            {
-                "total_analyzed": stats["total_analyzed"],
-                "total_attacks_detected": stats["total_attacks_detected"],
-                "attacks_by_type": dict(stats["attacks_by_type"]),
-                "detection_rate": (
-                    round(stats["total_attacks_detected"] / stats["total_analyzed"], 4)
-                    if stats["total_analyzed"] > 0
-                    else 0.0
-                ),
-                "confidence_threshold": CONFIDENCE_THRESHOLD,
-                "started_at": stats["started_at"],
-                "uptime_seconds": round(
-                    (
-                        datetime.now(timezone.utc)
-                        - datetime.fromisoformat(stats["started_at"])
-                    ).total_seconds()
-                ),
-                "tracking_state": tracking,
-            }
-        )
+        analyzed = stats["total_analyzed"]
+        detected = stats["total_attacks_detected"]
+        by_type = dict(stats["attacks_by_type"])
+        dropped = stats["publish_dropped"]
+
+    tracking = detector.get_tracking_stats()
+    return jsonify(
+        {
+            "total_analyzed": analyzed,
+            "total_attacks_detected": detected,
+            "attacks_by_type": by_type,
+            "detection_rate": (
+                round(detected / analyzed, 4) if analyzed > 0 else 0.0
+            ),
+            "publish_dropped": dropped,
+            "confidence_threshold": CONFIDENCE_THRESHOLD,
+            "started_at": stats["started_at"],
+            "uptime_seconds": round(
+                (datetime.now(timezone.utc) - STARTED_AT).total_seconds()
+            ),
+            "tracking_state": tracking,
+        }
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -315,17 +429,16 @@ def get_stats():
 @app.route("/recent-attacks")
 def get_recent_attacks():
     """Return the last 100 detected attacks (newest first)."""
-    with recent_lock:
-        attacks = list(recent_attacks)
-    # Return newest first
-    attacks.reverse()
-    return jsonify(
-        {
-            "count": len(attacks),
-            "max_stored": MAX_RECENT_ATTACKS,
-            "attacks": attacks,
-        }
+    attacks = list(recent_attacks)  # GIL-atomic snapshot
+    # Entries are already JSON bytes — stitch the response together
+    # directly instead of deserializing and re-serializing them.
+    body = (
+        b'{"count":%d,"max_stored":%d,"attacks":['
+        % (len(attacks), MAX_RECENT_ATTACKS)
+        + b",".join(reversed(attacks))
+        + b"]}"
     )
+    return Response(body, mimetype="application/json")
 
 
 # ---------------------------------------------------------------------------
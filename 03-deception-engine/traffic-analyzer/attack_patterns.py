@@ -2,24 +2,26 @@
 Attack Patterns — Detection logic for the traffic analyzer.
 
 Classifies HTTP requests into attack categories using compiled regex,
-rate tracking, and behavioral heuristics. Each detection method returns
-a list of findings (may be empty), where each finding is a dict:
-
-    {
-        "attack_type": str,      # e.g. "sqli", "xss", "path_traversal"
-        "confidence": float,     # 0.0 - 1.0
-        "source_ip": str,
-        "evidence": str,         # the matched pattern or trigger reason
-        "timestamp": str,        # ISO 8601
-        "raw_request_summary": dict
-    }
+rate tracking, and behavioral heuristics. Each detection method appends
+``Finding`` objects (a __slots__ record, see below) with:
+
+    attack_type : str        # e.g. "sqli", "xss", "path_traversal"
+    confidence : float       # 0.0 - 1.0
+    source_ip : str
+    evidence : str           # the matched pattern or trigger reason
+    timestamp : str          # ISO 8601
+    raw_request_summary : dict
+
+Call ``finding.to_dict()`` at the JSON boundary.
 
 All regex patterns are compiled at module load time for performance.
 """
 
 import re
+import threading
+from array import array
 import time
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict, deque
 from datetime import datetime, timezone
 
 
@@ -207,6 +209,119 @@ _DIR_ENUM_PATHS = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Auth-like endpoints for brute-force tracking — compiled once at import as
+# a single alternation, so the per-POST check is one engine traversal.
+# Matched against the already-lowercased path, so no IGNORECASE (same
+# lowercase-once discipline as the fused families).
+# ---------------------------------------------------------------------------
+_AUTH_ENDPOINT_RE = re.compile(
+    # [^/]+ instead of .+ — the greedy dot-plus followed by a literal is
+    # the classic backtracking shape; a slash-free segment matches in one
+    # linear pass (session ids never contain slashes)
+    r"/api/cart/[^/]+/checkout"
+    r"|/login\b"
+    r"|/admin/login\b"
+    r"|/wp-login"
+    r"|/auth\b"
+    r"|/signin\b"
+    r"|/api/token\b"
+    r"|/api/v\d+/auth",
+)
+
+# Exact-path fast path for the auth check: most auth endpoints are fixed
+# paths, so a single set probe on the lowercased path answers the common
+# case; the regex only runs when the probe misses (parametric or
+# substring forms like /api/cart/<id>/checkout or /wp-login.php).
+_AUTH_LITERALS = frozenset(
+    {"/login", "/admin/login", "/wp-login.php", "/auth", "/signin", "/api/token"}
+)
+
+
+# ---------------------------------------------------------------------------
+# Fused alternations — one scan per category instead of one per pattern
+# ---------------------------------------------------------------------------
+def _fuse_patterns(patterns):
+    """
+    Combine a category's patterns into a single compiled alternation.
+
+    Each source pattern becomes one alternative wrapped in its own capturing
+    group, with inner groups rewritten to non-capturing, so one pass of the
+    regex engine over the text replaces N independent searches and
+    ``m.lastindex`` identifies which source pattern fired.
+
+    Returns (compiled, labels, confidences) in struct-of-arrays layout —
+    labels[m.lastindex - 1] and confidences[m.lastindex - 1] describe a
+    match. Confidences live in a compact C double array; both are only
+    touched on the rare match path.
+    """
+    parts = []
+    labels = []
+    confidences = array("d")
+    for compiled, evidence, confidence in patterns:
+        # Neutralise unescaped capturing groups so alternative index ==
+        # capture-group index. None of the sources use backreferences.
+        source = re.sub(r"(?<!\\)\((?!\?)", "(?:", compiled.pattern)
+        # Inputs are lowercased once before scanning, so the fused pattern
+        # compiles without IGNORECASE — case-folding per character in the
+        # engine's inner loop is replaced by one pass over the text. Safe
+        # because the sources only use case-neutral escapes (\b \s \w \d).
+        parts.append(f"({source.lower()})")
+        labels.append(evidence)
+        confidences.append(confidence)
+    return re.compile("|".join(parts)), labels, confidences
+
+
+# Entries kept in the memoized pattern-scan cache (see _pattern_findings).
+# Keys are the scan text itself, so entries above the size cap are not
+# memoized — that bounds the cache at a few MB worst case, and oversized
+# requests (rare) simply rescan.
+_SCAN_CACHE_SIZE = 4096
+_SCAN_CACHE_MAX_KEY = 2048
+
+# Entries kept in the per-path dir-enum verdict cache (see _detect_dir_enum).
+_DIR_ENUM_CACHE_SIZE = 8192
+
+# Hard cap on IPs tracked per rate detector — bounds memory against spoofed
+# one-request-per-IP floods even between cleanup passes. On overflow the
+# oldest-inserted IP is evicted (dicts preserve insertion order).
+_MAX_TRACKED_IPS = 10000
+
+_SQLI_FUSED = _fuse_patterns(_SQLI_PATTERNS)
+_XSS_FUSED = _fuse_patterns(_XSS_PATTERNS)
+_PATH_TRAVERSAL_FUSED = _fuse_patterns(_PATH_TRAVERSAL_PATTERNS)
+_SCANNER_UA_FUSED = _fuse_patterns(_SCANNER_UA_PATTERNS)
+
+# Literal prefilter for the scanner-UA scan: ~99% of real user agents
+# contain none of these substrings, and 13 C-level `in` probes are far
+# cheaper than running the regex (still needed on hits for \b precision —
+# "zap" must not fire on "zapier").
+_SCANNER_LITERALS = (
+    "sqlmap", "nikto", "nmap", "dirbuster", "gobuster", "wfuzz", "burpsuite",
+    "hydra", "metasploit", "w3af", "zap", "masscan", "feroxbuster",
+)
+_DIR_ENUM_FUSED = _fuse_patterns(_DIR_ENUM_PATHS)
+
+
+# ---------------------------------------------------------------------------
+# Per-second cached ISO timestamp — all analyses within the same wall-clock
+# second share one string instead of each paying for a datetime allocation
+# plus isoformat() (same pattern as the analyzer and the deception
+# controller). The tuple swap is GIL-atomic. Findings carry second
+# resolution, which is what the event consumers display anyway.
+# ---------------------------------------------------------------------------
+_now_iso_cache = (0, "")
+
+
+def _now_iso():
+    sec = int(time.time())
+    cached_sec, cached = _now_iso_cache
+    if sec != cached_sec:
+        cached = datetime.now(timezone.utc).isoformat()
+        globals()["_now_iso_cache"] = (sec, cached)
+    return cached
+
+
 # ============================================================================
 # AttackDetector — stateful detector with rate tracking
 # ============================================================================
@@ -242,9 +357,37 @@ class AttackDetector:
         self.scan_threshold = scan_threshold
         self.scan_window = scan_window
 
-        # Rate tracking state: { ip: [(timestamp, path), ...] }
-        self._auth_attempts = defaultdict(list)
-        self._path_history = defaultdict(list)
+        # Rate tracking state, oldest entries first:
+        #   _auth_attempts: { ip: deque([timestamp, ...]) }
+        #   _path_history:  { ip: deque([(timestamp, path), ...]) }
+        # Deques make the window purge popleft-from-the-front, amortized
+        # O(expired), instead of rebuilding a list per request. Plain dicts
+        # with explicit creation (not defaultdict) so entries only ever
+        # materialize on the tracked write paths, capped at
+        # _MAX_TRACKED_IPS with oldest-IP eviction.
+        self._auth_attempts = {}
+        self._path_history = {}
+        # Path multiplicity within the window, maintained incrementally
+        # alongside _path_history so the unique-path count is len(counter)
+        # instead of building a set over the whole window per request.
+        self._path_counts = {}
+
+        # Running entry totals, maintained on append/purge so
+        # get_tracking_stats doesn't walk every IP's window per scrape
+        self._auth_total = 0
+        self._path_total = 0
+
+        # Memoized pattern-scan results: scan text -> finding templates.
+        # Scanners replay identical probes (sqlmap, dirbuster wordlists), so
+        # repeats skip the regex pass entirely.
+        self._scan_cache = OrderedDict()
+        self._scan_cache_lock = threading.Lock()
+
+        # Dir-enum verdicts keyed by truncated path — the patterns are all
+        # ^-anchored, so only the first path tokens matter, and scanner
+        # wordlists revisit the same paths constantly.
+        self._dir_enum_cache = OrderedDict()
+        self._dir_enum_lock = threading.Lock()
 
     # -----------------------------------------------------------------------
     # Public API
@@ -266,110 +409,103 @@ class AttackDetector:
             List of attack findings. Empty list means no attack detected.
         """
         findings = []
-        now = datetime.now(timezone.utc).isoformat()
+        now = _now_iso()
         source_ip = request_data.get("source_ip", "unknown")
 
+        # Extract once — the summary and the recon detector share it
+        user_agent = _extract_user_agent(request_data)
+
         # Build a summary for the raw_request_summary field
         summary = {
             "method": request_data.get("method", ""),
             "path": request_data.get("path", ""),
             "source_ip": source_ip,
-            "user_agent": _extract_user_agent(request_data),
+            "user_agent": user_agent,
         }
 
-        # Collect all text fields to scan for pattern-based detections
-        scan_fields = _collect_scan_fields(request_data)
-
-        # --- 1. SQL Injection ---
-        findings.extend(self._detect_sqli(scan_fields, source_ip, now, summary))
-
-        # --- 2. XSS ---
-        findings.extend(self._detect_xss(scan_fields, source_ip, now, summary))
-
-        # --- 3. Path Traversal ---
-        findings.extend(
-            self._detect_path_traversal(scan_fields, source_ip, now, summary)
-        )
-
-        # --- 4. Brute Force ---
-        bf = self._detect_brute_force(request_data, source_ip, now, summary)
-        if bf:
-            findings.append(bf)
-
-        # --- 5. Reconnaissance / Port Scanning ---
-        findings.extend(self._detect_recon(request_data, source_ip, now, summary))
+        # Concatenate all scannable text once — each fused pattern then
+        # walks a single haystack instead of being searched per field.
+        # \x01 can't appear mid-match, so it is a safe field separator.
+        haystack = _collect_scan_text(request_data)
+
+        # --- 1-3. SQL Injection / XSS / Path Traversal ---
+        # Stateless given the scan text, so the (attack_type, confidence,
+        # evidence) templates are memoized; per-request fields are filled
+        # in here on retrieval.
+        append = findings.append
+        for attack_type, confidence, evidence in self._pattern_findings(haystack):
+            append(
+                _make_finding(attack_type, confidence, source_ip, evidence, now, summary)
+            )
 
-        # --- 6. Directory Enumeration ---
-        findings.extend(self._detect_dir_enum(request_data, source_ip, now, summary))
+        # --- 4-6. Brute Force / Recon / Directory Enumeration ---
+        # The stateful detectors append into the shared findings list
+        # directly — no intermediate per-detector list to allocate, fill,
+        # extend-copy and discard on every request.
+        self._detect_brute_force(request_data, source_ip, now, summary, findings)
+        self._detect_recon(request_data, user_agent, source_ip, now, summary, findings)
+        self._detect_dir_enum(request_data, source_ip, now, summary, findings)
 
         return findings
 
     # -----------------------------------------------------------------------
     # Detection methods
     # -----------------------------------------------------------------------
-    def _detect_sqli(self, scan_fields, source_ip, timestamp, summary):
-        """Check all request fields against SQL injection patterns."""
-        findings = []
-        seen = set()  # avoid duplicate findings from same pattern
-        for text in scan_fields:
-            for pattern, evidence, confidence in _SQLI_PATTERNS:
-                if pattern.search(text) and evidence not in seen:
-                    seen.add(evidence)
-                    findings.append(
-                        _make_finding(
-                            "sqli",
-                            confidence,
-                            source_ip,
-                            evidence,
-                            timestamp,
-                            summary,
-                        )
-                    )
-        return findings
-
-    def _detect_xss(self, scan_fields, source_ip, timestamp, summary):
-        """Check all request fields against XSS patterns."""
-        findings = []
-        seen = set()
-        for text in scan_fields:
-            for pattern, evidence, confidence in _XSS_PATTERNS:
-                if pattern.search(text) and evidence not in seen:
-                    seen.add(evidence)
-                    findings.append(
-                        _make_finding(
-                            "xss",
-                            confidence,
-                            source_ip,
-                            evidence,
-                            timestamp,
-                            summary,
-                        )
-                    )
-        return findings
-
-    def _detect_path_traversal(self, scan_fields, source_ip, timestamp, summary):
-        """Check for directory traversal patterns in path and parameters."""
-        findings = []
-        seen = set()
-        for text in scan_fields:
-            for pattern, evidence, confidence in _PATH_TRAVERSAL_PATTERNS:
-                if pattern.search(text) and evidence not in seen:
-                    seen.add(evidence)
-                    findings.append(
-                        _make_finding(
-                            "path_traversal",
-                            confidence,
-                            source_ip,
-                            evidence,
-                            timestamp,
-                            summary,
-                        )
-                    )
-        return findings
+    def _pattern_findings(self, haystack):
+        """
+        Run the fused SQLi/XSS/traversal scans, memoized by scan text.
 
-    def _detect_brute_force(self, request_data, source_ip, timestamp, summary):
+        Returns a list of (attack_type, confidence, evidence) templates —
+        everything pattern-derived, nothing per-request — cached in a small
+        LRU so replayed probes cost one dict lookup instead of three scans.
+        """
+        # Keyed by the scan text itself, never its hash: a hash collision
+        # between two payloads would hand one request another request's
+        # verdict. Oversized haystacks skip the cache entirely.
+        cacheable = len(haystack) <= _SCAN_CACHE_MAX_KEY
+        if cacheable:
+            with self._scan_cache_lock:
+                cached = self._scan_cache.get(haystack)
+                if cached is not None:
+                    self._scan_cache.move_to_end(haystack)
+                    return cached
+
+        # The fused alternation answers "does anything in this family
+        # match?" in one pass — the fast path for benign traffic. On a
+        # hit it can't be trusted for completeness: overlapping
+        # alternatives suppress each other (the first alternative at a
+        # position wins and finditer resumes past the match), which
+        # drops e.g. the 0.95 "DROP statement" finding behind the 0.90
+        # "semicolon + keyword" one. So a family hit falls back to one
+        # search per source pattern, restoring exact per-pattern
+        # findings; the match already in hand is reused for its index.
+        templates = []
+        append = templates.append
+        for fused, attack_type, sources in (
+            (_SQLI_FUSED, "sqli", _SQLI_PATTERNS),
+            (_XSS_FUSED, "xss", _XSS_PATTERNS),
+            (_PATH_TRAVERSAL_FUSED, "path_traversal", _PATH_TRAVERSAL_PATTERNS),
+        ):
+            pattern, labels, confidences = fused
+            hit = pattern.search(haystack)
+            if hit is None:
+                continue
+            first = hit.lastindex - 1
+            for i, (compiled, _, _) in enumerate(sources):
+                if i == first or compiled.search(haystack) is not None:
+                    append((attack_type, confidences[i], labels[i]))
+
+        if cacheable:
+            with self._scan_cache_lock:
+                self._scan_cache[haystack] = templates
+                if len(self._scan_cache) > _SCAN_CACHE_SIZE:
+                    self._scan_cache.popitem(last=False)
+        return templates
+
+    def _detect_brute_force(self, request_data, source_ip, timestamp, summary, out):
         """
-        Track POST requests to auth-like endpoints per source IP.
+        Track POST requests to auth-like endpoints per source IP,
+        appending any finding to ``out``.
 
         Auth-like endpoints: /api/cart/*/checkout, /login, /admin/login,
         /wp-login.php, /auth, /signin, /api/token.
@@ -378,89 +514,110 @@ class AttackDetector:
         path = request_data.get("path", "")
 
         if method != "POST":
-            return None
-
-        # Check if path looks like an authentication endpoint
-        auth_patterns = [
-            re.compile(r"/api/cart/.+/checkout", re.IGNORECASE),
-            re.compile(r"/login\b", re.IGNORECASE),
-            re.compile(r"/admin/login\b", re.IGNORECASE),
-            re.compile(r"/wp-login", re.IGNORECASE),
-            re.compile(r"/auth\b", re.IGNORECASE),
-            re.compile(r"/signin\b", re.IGNORECASE),
-            re.compile(r"/api/token\b", re.IGNORECASE),
-            re.compile(r"/api/v\d+/auth", re.IGNORECASE),
-        ]
-
-        is_auth = any(p.search(path) for p in auth_patterns)
-        if not is_auth:
-            return None
+            return
 
-        now = time.monotonic()
+        # Check if path looks like an authentication endpoint — O(1) set
+        # probe first, regex alternation only on a miss
+        lp = path.lower()
+        if lp not in _AUTH_LITERALS and _AUTH_ENDPOINT_RE.search(lp) is None:
+            return
 
-        # Append this attempt
-        self._auth_attempts[source_ip].append(now)
+        now = time.monotonic()
 
-        # Purge entries outside the window
+        # Append this attempt, then pop expired entries off the front
+        dq = self._auth_attempts.get(source_ip)
+        if dq is None:
+            if len(self._auth_attempts) >= _MAX_TRACKED_IPS:
+                oldest = next(iter(self._auth_attempts))
+                self._auth_total -= len(self._auth_attempts.pop(oldest))
+            dq = deque()
+            self._auth_attempts[source_ip] = dq
+        dq.append(now)
+        self._auth_total += 1
         cutoff = now - self.brute_force_window
-        self._auth_attempts[source_ip] = [
-            t for t in self._auth_attempts[source_ip] if t > cutoff
-        ]
+        while dq and dq[0] <= cutoff:
+            dq.popleft()
+            self._auth_total -= 1
 
-        count = len(self._auth_attempts[source_ip])
+        count = len(dq)
         if count >= self.brute_force_threshold:
             # Confidence scales with how far above the threshold we are
             confidence = min(0.60 + (count - self.brute_force_threshold) * 0.08, 0.98)
-            return _make_finding(
-                "brute_force",
-                confidence,
-                source_ip,
-                f"{count} auth attempts in {self.brute_force_window}s to {path}",
-                timestamp,
-                summary,
+            out.append(
+                _make_finding(
+                    "brute_force",
+                    confidence,
+                    source_ip,
+                    f"{count} auth attempts in {self.brute_force_window}s to {path}",
+                    timestamp,
+                    summary,
+                )
             )
 
-        return None
-
-    def _detect_recon(self, request_data, source_ip, timestamp, summary):
+    def _detect_recon(self, request_data, user_agent, source_ip, timestamp, summary, out):
         """
-        Detect reconnaissance scanning: rapid unique path enumeration
-        and known scanner user-agents.
+        Detect reconnaissance scanning (rapid unique path enumeration and
+        known scanner user-agents), appending findings to ``out``.
+
+        The caller extracts the User-Agent once and passes it in — no
+        second walk over the headers dict.
         """
-        findings = []
         path = request_data.get("path", "")
-        user_agent = _extract_user_agent(request_data)
 
-        # --- Scanner user-agent detection ---
-        for pattern, evidence, confidence in _SCANNER_UA_PATTERNS:
-            if pattern.search(user_agent):
-                findings.append(
-                    _make_finding(
-                        "recon_scanner",
-                        confidence,
-                        source_ip,
-                        f"Scanner UA detected: {evidence}",
-                        timestamp,
-                        summary,
-                    )
+        # --- Scanner user-agent detection (one fused scan; first match wins) ---
+        ua_lower = user_agent.lower()
+        m = (
+            _SCANNER_UA_FUSED[0].search(ua_lower)
+            if any(lit in ua_lower for lit in _SCANNER_LITERALS)
+            else None
+        )
+        if m:
+            i = m.lastindex - 1
+            evidence = _SCANNER_UA_FUSED[1][i]
+            confidence = _SCANNER_UA_FUSED[2][i]
+            out.append(
+                _make_finding(
+                    "recon_scanner",
+                    confidence,
+                    source_ip,
+                    f"Scanner UA detected: {evidence}",
+                    timestamp,
+                    summary,
                 )
-                # One scanner match is enough
-                break
+            )
 
         # --- Rapid path enumeration ---
         now = time.monotonic()
-        self._path_history[source_ip].append((now, path))
-
-        # Purge entries outside the window
+        dq = self._path_history.get(source_ip)
+        if dq is None:
+            if len(self._path_history) >= _MAX_TRACKED_IPS:
+                oldest = next(iter(self._path_history))
+                self._path_total -= len(self._path_history.pop(oldest))
+                self._path_counts.pop(oldest, None)
+            dq = deque()
+            self._path_history[source_ip] = dq
+            counts = Counter()
+            self._path_counts[source_ip] = counts
+        else:
+            counts = self._path_counts[source_ip]
+        dq.append((now, path))
+        counts[path] += 1
+        self._path_total += 1
+
+        # Pop expired entries off the front of the window, keeping the
+        # path multiplicity counter in sync
         cutoff = now - self.scan_window
-        self._path_history[source_ip] = [
-            (t, p) for t, p in self._path_history[source_ip] if t > cutoff
-        ]
-
-        unique_paths = len(set(p for _, p in self._path_history[source_ip]))
+        while dq and dq[0][0] <= cutoff:
+            _, old_path = dq.popleft()
+            counts[old_path] -= 1
+            if not counts[old_path]:
+                del counts[old_path]
+            self._path_total -= 1
+
+        unique_paths = len(counts)
         if unique_paths >= self.scan_threshold:
             confidence = min(0.65 + (unique_paths - self.scan_threshold) * 0.05, 0.98)
-            findings.append(
+            out.append(
                 _make_finding(
                     "recon_scanning",
                     confidence,
@@ -471,29 +628,44 @@ class AttackDetector:
                 )
             )
 
-        return findings
-
-    def _detect_dir_enum(self, request_data, source_ip, timestamp, summary):
-        """Check if the requested path matches known sensitive/admin endpoints."""
+    def _detect_dir_enum(self, request_data, source_ip, timestamp, summary, out):
+        """
+        Check if the requested path matches known sensitive/admin
+        endpoints, appending any finding to ``out``.
+        """
         path = request_data.get("path", "")
-        findings = []
-
-        for pattern, evidence, confidence in _DIR_ENUM_PATHS:
-            if pattern.search(path):
-                findings.append(
-                    _make_finding(
-                        "dir_enum",
-                        confidence,
-                        source_ip,
-                        evidence,
-                        timestamp,
-                        summary,
-                    )
-                )
-                # One directory enumeration match per request is sufficient
-                break
 
-        return findings
+        # The verdict depends only on the leading path tokens (patterns are
+        # ^-anchored), so memoize it per query-stripped, truncated path.
+        key = path.split("?", 1)[0][:64].lower()
+        with self._dir_enum_lock:
+            if key in self._dir_enum_cache:
+                self._dir_enum_cache.move_to_end(key)
+                template = self._dir_enum_cache[key]
+                cached = True
+            else:
+                cached = False
+
+        if not cached:
+            # One fused scan; one dir-enum match per request suffices
+            m = _DIR_ENUM_FUSED[0].search(key)
+            template = None
+            if m:
+                i = m.lastindex - 1
+                template = (_DIR_ENUM_FUSED[1][i], _DIR_ENUM_FUSED[2][i])
+            with self._dir_enum_lock:
+                self._dir_enum_cache[key] = template
+                if len(self._dir_enum_cache) > _DIR_ENUM_CACHE_SIZE:
+                    self._dir_enum_cache.popitem(last=False)
+
+        if template is None:
+            return
+        evidence, confidence = template
+        out.append(
+            _make_finding(
+                "dir_enum", confidence, source_ip, evidence, timestamp, summary
+            )
+        )
 
     # -----------------------------------------------------------------------
     # State maintenance
@@ -507,29 +679,41 @@ class AttackDetector:
         """
         cutoff = time.monotonic() - max_age
 
+        # Entries are time-ordered, so purging is popleft-from-the-front —
+        # O(expired) with no reallocation; only emptied IPs need a second
+        # pass to drop their keys.
         stale_ips = []
-        for ip, entries in self._auth_attempts.items():
-            self._auth_attempts[ip] = [t for t in entries if t > cutoff]
-            if not self._auth_attempts[ip]:
+        for ip, dq in self._auth_attempts.items():
+            while dq and dq[0] <= cutoff:
+                dq.popleft()
+                self._auth_total -= 1
+            if not dq:
                 stale_ips.append(ip)
         for ip in stale_ips:
             del self._auth_attempts[ip]
 
         stale_ips = []
-        for ip, entries in self._path_history.items():
-            self._path_history[ip] = [(t, p) for t, p in entries if t > cutoff]
-            if not self._path_history[ip]:
+        for ip, dq in self._path_history.items():
+            counts = self._path_counts[ip]
+            while dq and dq[0][0] <= cutoff:
+                _, old_path = dq.popleft()
+                counts[old_path] -= 1
+                if not counts[old_path]:
+                    del counts[old_path]
+                self._path_total -= 1
+            if not dq:
                 stale_ips.append(ip)
         for ip in stale_ips:
             del self._path_history[ip]
+            del self._path_counts[ip]
 
     def get_tracking_stats(self):
-        """Return current state sizes for diagnostics."""
+        """Return current state sizes for diagnostics (all O(1) reads)."""
         return {
             "tracked_ips_auth": len(self._auth_attempts),
             "tracked_ips_paths": len(self._path_history),
-            "total_auth_entries": sum(len(v) for v in self._auth_attempts.values()),
-            "total_path_entries": sum(len(v) for v in self._path_history.values()),
+            "total_auth_entries": self._auth_total,
+            "total_path_entries": self._path_total,
         }
 
 
@@ -538,16 +722,50 @@ class AttackDetector:
 # ============================================================================
 
 
-def _make_finding(attack_type, confidence, source_ip, evidence, timestamp, summary):
-    """Construct a standardised finding dict."""
-    return {
-        "attack_type": attack_type,
-        "confidence": round(confidence, 2),
-        "source_ip": source_ip,
-        "evidence": evidence,
-        "timestamp": timestamp,
-        "raw_request_summary": summary,
-    }
+class Finding:
+    """
+    A single attack finding.
+
+    __slots__ record instead of a dict: fixed attribute offsets, no
+    per-instance hash table, roughly 40% smaller and faster to build —
+    it matters on noisy requests that fire a dozen findings. Convert
+    with to_dict() once at the JSON boundary.
+    """
+
+    __slots__ = (
+        "attack_type",
+        "confidence",
+        "source_ip",
+        "evidence",
+        "timestamp",
+        "raw_request_summary",
+    )
+
+    def __init__(
+        self, attack_type, confidence, source_ip, evidence, timestamp, summary
+    ):
+        self.attack_type = attack_type
+        self.confidence = round(confidence, 2)
+        self.source_ip = source_ip
+        self.evidence = evidence
+        self.timestamp = timestamp
+        self.raw_request_summary = summary
+
+    def to_dict(self):
+        """Return the dict form for JSON serialization."""
+        return {
+            "attack_type": self.attack_type,
+            "confidence": self.confidence,
+            "source_ip": self.source_ip,
+            "evidence": self.evidence,
+            "timestamp": self.timestamp,
+            "raw_request_summary": self.raw_request_summary,
+        }
+
+
+# Kept as the construction point the detectors call — reads the same at
+# the call sites as the old dict builder.
+_make_finding = Finding
 
 
 def _extract_user_agent(request_data):
@@ -555,50 +773,72 @@ def _extract_user_agent(request_data):
     headers = request_data.get("headers", {})
     if not headers:
         return ""
-    # Headers may be any casing
+    # The two canonical spellings cover nearly all traffic in one hash
+    # lookup each; fall back to the linear case-insensitive walk for
+    # exotic casings.
+    ua = headers.get("User-Agent") or headers.get("user-agent")
+    if ua is not None:
+        return ua
     for key, value in headers.items():
         if key.lower() == "user-agent":
             return value
     return ""
 
 
-def _collect_scan_fields(request_data):
+def _collect_scan_text(request_data):
     """
-    Gather all text fields from the request that should be scanned
-    for pattern-based attacks (SQLi, XSS, path traversal).
+    Gather all text fields from the request that should be scanned for
+    pattern-based attacks (SQLi, XSS, path traversal) and join them into
+    one \x01-separated haystack.
 
-    Returns a list of strings. Empty/missing fields are skipped.
+    Returned text is lowercased (the fused patterns compile without
+    IGNORECASE, so inputs are case-folded here, once per field).
+    Empty/missing fields are skipped.
     """
-    fields = []
-
     path = request_data.get("path", "")
+
+    # Fast path: a bare GET with no body, query or headers (health checks,
+    # internal probes) has nothing to scan but the path — skip the list
+    # build and join entirely.
+    if not (
+        request_data.get("body")
+        or request_data.get("query_params")
+        or request_data.get("headers")
+    ):
+        return path.lower() if path else ""
+
+    fields = []
     if path:
-        fields.append(path)
+        fields.append(path.lower())
 
-    # Query parameters — flatten values
+    # Query parameters — flatten values. Values are almost always str
+    # already; only box through str() when they aren't.
     query = request_data.get("query_params", {})
     if isinstance(query, dict):
         for v in query.values():
             if isinstance(v, list):
-                fields.extend(str(item) for item in v)
+                fields.extend(
+                    (item if isinstance(item, str) else str(item)).lower()
+                    for item in v
+                )
             else:
-                fields.append(str(v))
+                fields.append((v if isinstance(v, str) else str(v)).lower())
     elif isinstance(query, str) and query:
-        fields.append(query)
+        fields.append(query.lower())
 
     # Request body
     body = request_data.get("body", "")
     if isinstance(body, dict):
         # Flatten dict values for scanning
         for v in body.values():
-            fields.append(str(v))
+            fields.append((v if isinstance(v, str) else str(v)).lower())
     elif isinstance(body, str) and body:
-        fields.append(body)
+        fields.append(body.lower())
 
     # Headers — scan all header values
     headers = request_data.get("headers", {})
     if isinstance(headers, dict):
         for v in headers.values():
-            fields.append(str(v))
+            fields.append((v if isinstance(v, str) else str(v)).lower())
 
-    return fields
+    return "\x01".join(fields)
